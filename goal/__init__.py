@@ -1,4 +1,20 @@
-from .main import main, option
+from .option import option
+from .stats import Statistics
 
-__ALL__ = ["main, option"]
 
+def main(title=None):
+    """
+    goal 화면을 띄웁니다
+
+    scene 과 화면 클래스 (goal.app 모듈) 는 처음 부를때 불러옵니다\n
+    option, Statistics, storage 는 scene 없이 불러올 수 있습니다
+
+    Args:
+        title (str): 타이틀, 없다면 실행한 파일 이름
+    """
+    from .app import main
+
+    return main(title)
+
+
+__all__ = ["main", "option", "Statistics"]
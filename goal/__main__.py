@@ -0,0 +1,111 @@
+"""
+화면 없이 체크하고 기록을 확인하는 명령어
+
+저장소만 불러오므로 scene 없이 바로 실행됩니다 (단축어, 자동화용)
+
+    python -m goal -f 걷기.py check
+    python -m goal -f 걷기.py uncheck 2023-05-01
+    python -m goal -f 걷기.py query 2023-05-01 2023-05-31
+    python -m goal -f 걷기.py --json stats
+"""
+
+import os, sys, json, argparse
+from datetime import date
+
+from .storage import openStorage
+from .stats import Statistics
+
+
+def parseDate(text) -> date:
+    """
+    YYYY-MM-DD 또는 today
+    """
+    if text in (None, "today"):
+        return date.today()
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜는 YYYY-MM-DD: {text}")
+
+
+def commit(storage, day, is_bool) -> dict:
+    """
+    day 를 체크 또는 체크 해제하고 저장이 끝날때까지 기다림
+    """
+    storage.commit(day.year, day.month, day.day, is_bool)
+    storage.flush()
+    storage.save(day.year, day.month)
+    return {"date": day.isoformat(), "checked": is_bool}
+
+
+def query(storage, start, end) -> dict:
+    """
+    start 부터 end 까지 체크된 날짜
+    """
+    days = storage.days(start, end)
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "count": len(days),
+        "days": [d.isoformat() for d in days],
+    }
+
+
+def stats(storage, today) -> dict:
+    """
+    today 기준 통계
+    """
+    return Statistics(storage).summary(today)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m goal")
+    parser.add_argument("-f", "--file", required=True, help="goal 을 실행하는 파일, 같은 폴더에 파일 이름으로 저장됨")
+    parser.add_argument("-s", "--storage", default="json", choices=("json", "bitmap", "sqlite"))
+    parser.add_argument("--json", action="store_true", help="결과를 json 으로 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("check", "uncheck"):
+        command = commands.add_parser(name)
+        command.add_argument("date", nargs="?", type=parseDate, default=None)
+    command = commands.add_parser("query")
+    command.add_argument("start", type=parseDate)
+    command.add_argument("end", nargs="?", type=parseDate, default=None)
+    command = commands.add_parser("stats")
+    command.add_argument("date", nargs="?", type=parseDate, default=None)
+    args = parser.parse_args(argv)
+
+    # goal 패키지 옆의 goal.py 라면 저장 폴더가 패키지 폴더가 되므로 막음
+    package = os.path.dirname(os.path.abspath(__file__))
+    if os.path.splitext(os.path.abspath(args.file))[0] == package:
+        parser.error(f"{args.file} 의 저장 폴더가 goal 패키지 폴더와 같음, 다른 파일 이름을 쓰세요")
+    try:
+        storage = openStorage(args.file, args.storage)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        if args.command in ("check", "uncheck"):
+            day = args.date or date.today()
+            epoch = getattr(storage, "epoch", None)  # bitmap 저장소는 epoch 부터 저장함
+            if epoch is not None and day < epoch:
+                parser.error(f"{args.storage} 저장소는 {epoch} 이전 날짜를 저장할 수 없음: {day}")
+            result = commit(storage, day, args.command == "check")
+        elif args.command == "query":
+            result = query(storage, args.start, args.end or args.start)
+        else:
+            result = stats(storage, args.date or date.today())
+    finally:
+        storage.close()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+    elif args.command == "query":
+        print("\n".join(result["days"]))
+    else:
+        for key, value in result.items():
+            print(f"{key}: {value:.2%}" if isinstance(value, float) else f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+여러 년도의 기록을 NumPy 배열로 분석하는 모듈
+
+scene 없이 쓸 수 있습니다 (numpy 필요)
+
+    from goal.analytics import History
+    history = History.open("goal.py")
+    history.weekdays()
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from .option import Setting
+from .storage import openStorage, BitmapFile
+
+
+class History:
+    """
+    start 부터 하루에 한칸씩 체크 여부를 가진 bool 배열
+
+    Args:
+        start (date): days[0] 의 날짜\n
+        days (np.ndarray): bool 배열
+    """
+
+    def __init__(self, start, days):
+        self.start = start
+        self.days = np.asarray(days, dtype=bool)
+
+    @classmethod
+    def open(cls, script, kind=None, start=None, end=None):
+        """
+        DataController 와 같은 위치의 저장소에서 기록을 읽어옴
+
+        Args:
+            script (str): goal 을 실행하는 파일 위치\n
+            kind (str): 저장소 종류, 없다면 option 에서 고른 저장소\n
+            start (date), end (date): 없다면 기록이 있는 년도 전체
+
+        Returns:
+            History
+        """
+        storage = openStorage(script, kind or Setting.storage)
+        try:
+            return cls.fromStorage(storage, start, end)
+        finally:
+            storage.close()
+
+    @classmethod
+    def fromStorage(cls, storage, start=None, end=None):
+        """
+        저장소에서 start 부터 end 까지 기록을 읽어옴
+
+        Args:
+            storage (Storage)\n
+            start (date), end (date): 없다면 기록이 있는 년도 전체
+
+        Returns:
+            History
+        """
+        if start is None or end is None:
+            years = storage.years() or [date.today().year]
+            start = start or date(years[0], 1, 1)
+            end = end or date(years[-1], 12, 31)
+        length = (end - start).days + 1
+
+        if isinstance(storage, BitmapFile) and start >= storage.epoch:
+            # 파일의 비트를 그대로 펼침
+            storage.flush()
+            offset = (start - storage.epoch).days & 7
+            with storage.lock, storage.view(start, end) as view:
+                bits = np.unpackbits(np.frombuffer(view, np.uint8), bitorder="little")
+            days = np.zeros(length, dtype=bool)
+            bits = bits[offset : offset + length]
+            days[: len(bits)] = bits
+            return cls(start, days)
+
+        days = np.zeros(length, dtype=bool)
+        for year in range(start.year, end.year + 1):
+            data = storage.readYear(year)
+            for month in range(1, 12 + 1):
+                first = (date(year, month, 1) - start).days
+                month_bits = data[str(month)].bits.to_bytes(4, "little")
+                bits = np.unpackbits(np.frombuffer(month_bits, np.uint8), bitorder="little")
+                lo, hi = max(first, 0), min(first + 31, length)
+                if lo < hi:
+                    days[lo:hi] |= bits[lo - first : hi - first].astype(bool)
+        return cls(start, days)
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=len(self.days) - 1)
+
+    def dates(self) -> np.ndarray:
+        """
+        각 칸의 날짜 (datetime64[D])
+        """
+        return np.datetime64(self.start, "D") + np.arange(len(self.days))
+
+    def weekdays(self) -> np.ndarray:
+        """
+        요일별 체크 개수
+
+        Returns:
+            np.ndarray: 길이 7, 0 - 월요일
+        """
+        weekday = (self.start.weekday() + np.arange(len(self.days))) % 7
+        return np.bincount(weekday[self.days], minlength=7)
+
+    def weekdayRates(self) -> np.ndarray:
+        """
+        요일별 달성률 (0~1)
+        """
+        weekday = (self.start.weekday() + np.arange(len(self.days))) % 7
+        total = np.bincount(weekday, minlength=7)
+        return self.weekdays() / np.maximum(total, 1)
+
+    def runs(self):
+        """
+        연속 기록들
+
+        Returns:
+            (np.ndarray, np.ndarray): 시작 위치, 길이
+        """
+        edges = np.diff(np.concatenate(([0], self.days.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return starts, ends - starts
+
+    def longest(self) -> int:
+        """
+        가장 긴 연속 기록
+        """
+        _, lengths = self.runs()
+        return int(lengths.max()) if len(lengths) else 0
+
+    def moving(self, window) -> np.ndarray:
+        """
+        최근 window 일의 달성률 (이동 평균)
+
+        Returns:
+            np.ndarray: i 번째는 i-window+1 ~ i 번째 날의 평균, 앞쪽은 있는 날만으로 나눔
+        """
+        total = np.cumsum(self.days, dtype=np.int64)
+        shifted = np.concatenate((np.zeros(window, np.int64), total[:-window]))[: len(total)]
+        count = np.minimum(np.arange(1, len(total) + 1), window)
+        return (total - shifted) / count
+
+    def years(self) -> dict:
+        """
+        년도별 체크 개수와 달성률
+
+        Returns:
+            dict: {년: (개수, 달성률)}
+        """
+        years = range(self.start.year, self.end.year + 1)
+        bounds = np.array([max((date(year, 1, 1) - self.start).days, 0) for year in years])
+        counts = np.add.reduceat(self.days.astype(np.int64), bounds)
+        lengths = np.diff(np.append(bounds, len(self.days)))
+        rates = counts / lengths
+        return {
+            year: (int(count), float(rate))
+            for year, count, rate in zip(years, counts, rates)
+        }
+
+    def yearOverYear(self) -> dict:
+        """
+        작년보다 달성률이 얼마나 바뀌었는지
+
+        Returns:
+            dict: {년: 올해 달성률 - 작년 달성률}
+        """
+        rates = {year: rate for year, (_, rate) in self.years().items()}
+        return {year: rate - rates[year - 1] for year, rate in rates.items() if year - 1 in rates}
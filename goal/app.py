@@ -1,181 +1,172 @@
-import os, sys, json
-from math import sqrt
+import os, sys
+from bisect import bisect
 from datetime import date
-from dateutil.relativedelta import relativedelta
 from typing import Union, Tuple
 
-from scene import run, Scene
-from scene import SpriteNode, LabelNode
-from scene import Action as A
-from scene import TIMING_ELASTIC_OUT
+try:
+    from scene import run, Scene
+    from scene import Node, SpriteNode, LabelNode
+    from scene import Action as A
+    from scene import TIMING_ELASTIC_OUT
+except ImportError:
+    # pythonista3 밖에서는 화면 없이 기록만 하는 headless 모듈을 씀
+    from .headless import run, Scene
+    from .headless import Node, SpriteNode, LabelNode
+    from .headless import Action as A
+    from .headless import TIMING_ELASTIC_OUT
 
 from .check import *
 from .option import option, Setting
+from .storage import openStorage
+from .cache import YearCache
+from .bitmap import MonthBits
+from .latency import Latency, NoLatency
+from .prefetch import Prefetcher
+from .glyph import GlyphCache
+from .grid import MonthGrid, shiftMonth, lastDay
+from .stats import Statistics
 
 
 def emptyFunction():
     pass
 
 
-class File:
+def showNode(node, parent):
     """
-    파일 쓰기, 읽기 기능이 있는 클래스
+    다시 쓰는 노드를 parent 에 붙이고 원래 상태로 되돌림
 
     Args:
-        path (str): 읽고 쓸 위치
+        node (Node)\n
+        parent (Node)
     """
+    node.remove_all_actions()
+    node.scale = 1
+    node.alpha = 1
+    if node.parent is None:
+        parent.add_child(node)
 
-    def __init__(self, path):
-        self.path = path
 
-    def read(self, year) -> dict:
-        """
-        json 데이터를 읽어서 dict 형식으로 변환
-
-        Args:
-            year (int): 파일의 이름 2023.json
-
-        Returns:
-            dict: 읽어온 파일의 정보를 리턴
-        """
-        name = os.path.join(self.path, f"{year}.json")
-        with open(name, "r", encoding="utf-8") as f:
-            data = f.read()
-        return json.loads(data)
-
-    def write(self, year, data):
-        """
-        파일을 읽고 json 형식으로 저장
-
-        Args:
-            year (int): 파일의 이름 2023.json
-            data (int): 파일에 저장할 데이터 정보
-
-        Returns:
-            dict: 읽어온 파일의 정보를 리턴
-        """
-        if isinstance(data, dict):
-            data = json.dumps(data)
-
-        name = os.path.join(self.path, f"{year}.json")
-        with open(name, "w", encoding="utf-8") as f:
-            f.write(data)
-
-    def isfile(self, year) -> bool:
-        """
-        파일이 존재하는지 확인
-
-        Args:
-            year (int): 파일의 이름 2023.json
+def hideNode(node):
+    """
+    노드를 화면에서 뗌
 
-        Returns:
-            bool: 파일의 존재여부
-        """
-        return os.path.isfile(os.path.join(self.path, f"{year}.json"))
+    Args:
+        node (Node)
+    """
+    node.remove_all_actions()
+    node.remove_from_parent()
 
 
 class DataController:
     """
-    파일을 저장하고 관리하는 클래스
+    파일을 저장하고 관리하는 클래스
+
+    저장은 option 에서 고른 Storage 클래스가 합니다
 
     Args:
-        date_class (Data): 날짜 정보가 들어간 Data 클래스
-                          Data 클래스는 datetime 모듈의 date를 기반
+        date_class (Data): 날짜 정보가 들어간 Data 클래스
+                          Data 클래스는 datetime 모듈의 date를 기반
+        script (str): 실행한 파일 위치, 없다면 sys.argv[0]\n
+                      같은 폴더에 파일 이름으로 저장합니다
     """
 
-    def __init__(self, date_class):
-        path, name = os.path.split(sys.argv[0])
-        name = os.path.splitext(name)[0]
-        path = os.path.join(path, name)
-
-        self.data = []
-        self.file = File(path)
+    def __init__(self, date_class, script=None):
+        if script is None:
+            script = sys.argv[0]
 
-        if not os.path.isdir(path):
-            os.mkdir(path)
+        self.data = MonthBits()
+        self.storage = openStorage(script, Setting.storage)
+        self.cache = YearCache()
+        self.stats = Statistics(self.storage)  # 처음 쓸때 기록을 읽음
 
         year, month = date_class.year, date_class.month
-        self.__createJsonFile(year)
         self.open(year, month)
 
     def commit(self, is_bool, num, year, month):
         """
-        데이터를 집어넣을지, 지울지 결정한 후 저장합니다
+        데이터를 집어넣을지, 지울지 결정한 후 저장소에 넘깁니다
 
         Args:
-            is_bool (bool): 집어넣을지 지울지 결정.
-            num (int): 집어넣을지 지울지 결정될 정보
+            is_bool (bool): 집어넣을지 지울지 결정.
+            num (int): 집어넣을지 지울지 결정될 정보
         """
         if is_bool:
             self.append(num)
         else:
             self.remove(num)
 
-        self.save(year, month)
+        self.cache.markDirty(year, month)
+        self.storage.commit(year, month, num, is_bool)
+        self.stats.update(year, month, num, is_bool)
 
     def append(self, num):
         """
-        데이터를 집어넣고 순서대로 정렬합니다
+        데이터를 집어넣습니다
 
         Args:
-            num (int): 집어넣을 정보
+            num (int): 집어넣을 정보
         """
-        self.data.append(num)
-        self.data.sort()
+        self.data.add(num)
 
     def remove(self, num):
         """
-        데이터를 지웁니다
+        데이터를 지웁니다
 
         Args:
-            num (int): 지울 정보
+            num (int): 지울 정보
         """
-        self.data.remove(num)
+        self.data.discard(num)
 
     def save(self, year, month):
         """
-        기존 데이터를 File 클래스로 저장
+        달이 바뀔때 저장소가 모아둔 기록을 정리하도록 합니다
+
+        commit 할때 이미 저장소에 넘기므로 바로 쓰지 않습니다\n
+        바뀐게 없는 달이라면 실행되지 않습니다
 
         Args:
-            year (int): 파일의 이름 2023.json
-            data (int): 파일에 저장할 데이터 정보
+            year (int): 파일의 이름 2023.json
+            data (int): 파일에 저장할 데이터 정보
         """
-        dic = self.file.read(year)
-        dic[str(month)] = self.data
+        if not self.cache.isDirty(year, month):
+            return
 
-        self.file.write(year, dic)
+        self.cache.clean(year, month)
+        self.storage.save(year, month)
 
     def open(self, year, month):
         """
-        파일에서 데이터를 읽어옵니다
+        데이터를 읽어옵니다\n
+        이미 읽어온 년도라면 저장소를 읽지 않고 YearCache 에서 가져옵니다
 
         Args:
-            year (int): 파일의 이름 2023.json
-            data (int): 파일에 읽어올 데이터 정보
+            year (int): 파일의 이름 2023.json
+            data (int): 파일에 읽어올 데이터 정보
         """
-        self.__createJsonFile(year)
+        self.data = self.cache.get(year, self.storage.readYear)[str(month)]
 
-        self.data = self.file.read(year)[str(month)]
-
-    def __createJsonFile(self, year):
+    def preload(self, year):
         """
-        json 파일을 만듭니다\n
-        만약 파일이 있다면 실행되지 않습니다
+        년도 데이터를 미리 읽어서 YearCache 에 넣어둡니다\n
+        미리 읽는 쓰레드에서 부릅니다
 
         Args:
-            year (int): 파일의 이름 2023.json
+            year (int)
         """
-        if self.file.isfile(year):
-            return
+        if not self.cache.peek(year):
+            self.cache.get(year, self.storage.readYear)
 
-        data = self.__createData()
-        self.file.write(year, data)
+    def flush(self):
+        """
+        대기중인 기록이 저장될때까지 기다립니다
+        """
+        self.storage.flush()
 
-    def __createData(self):
+    def close(self):
         """
-        새로운 데이터를 만듭니다
+        저장이 끝날때까지 기다립니다
         """
-        return dict.fromkeys((str(i) for i in range(1, 12 + 1)), [])
+        self.storage.close()
 
 
 class Screen:
@@ -193,6 +184,34 @@ class Action(Screen):
     Node 클래스 들의 움직임 담당하는 클래스
     """
 
+    ripple_size = 4  # 한번에 퍼질 수 있는 물결 개수
+    ripple_gap = 0.05  # 물결 사이 최소 간격 (초)
+    ripple_list = []  # 돌려쓰는 물결 노드
+    ripple_index = 0  # 다음에 쓸 물결 노드
+    ripple_time = None  # 마지막 물결을 만든 시간
+    busy_until = 0.0  # 실행한 액션이 모두 끝나는 시간 (scene.t)
+
+    @classmethod
+    def busy(cls, duration):
+        """
+        duration 초 동안 화면이 움직인다고 표시\n
+        그동안은 화면을 멈추지 않습니다
+
+        Args:
+            duration (숫자): 초
+        """
+        cls.busy_until = max(cls.busy_until, cls.screen.t + duration)
+
+    @classmethod
+    def isIdle(cls, delay=0) -> bool:
+        """
+        실행중인 액션이 없는지 확인
+
+        Args:
+            delay (숫자): 액션이 끝나고도 이만큼 (초) 지나야 idle
+        """
+        return cls.busy_until + delay <= cls.screen.t
+
     @classmethod
     def buttonClick(cls, object):
         """
@@ -207,6 +226,7 @@ class Action(Screen):
                 A.scale_to(1, 0.2, TIMING_ELASTIC_OUT),
             ),
         )
+        cls.busy(0.4)
 
     @classmethod
     def moveUpFadeIn(cls, object):
@@ -230,9 +250,10 @@ class Action(Screen):
                 ),
             ),
         )
+        cls.busy(0.2)
 
-    @staticmethod
-    def moveUpFadeOut(object):
+    @classmethod
+    def moveUpFadeOut(cls, object):
         """
         위로 움직이면서 흐릿해지고 작아짐
 
@@ -249,30 +270,50 @@ class Action(Screen):
                 A.remove(),
             ),
         )
+        cls.busy(0.2)
 
     @classmethod
     def screenClick(cls, object, position):
         """
         화면 클릭: 물결이 퍼지는 효과
 
+        물결 노드는 ripple_size 개를 가장 오래된 것부터 돌려쓰고\n
+        ripple_gap 초 안에 다시 누르면 물결을 만들지 않음
+
         Args:
-            object (Node)
+            object (Scene)
             position (숫자, 숫자): 클릭 위치
         """
-        s = SpriteNode("shp:wavering", position=position, scale=0, parent=object)
-        s.run_action(
-            A.sequence(
-                A.group(
-                    A.scale_to(1),
-                    A.fade_to(0),
-                ),
-                A.remove(),
-            ),
-        )
-        object.run_action(A.sequence(A.wait(2), A.call(emptyFunction)))
+        if cls.ripple_time is not None and object.t - cls.ripple_time < cls.ripple_gap:
+            return
+        cls.ripple_time = object.t
+
+        if len(cls.ripple_list) < cls.ripple_size:
+            s = SpriteNode("shp:wavering", parent=object)
+            cls.ripple_list.append(s)
+        else:
+            s = cls.ripple_list[cls.ripple_index]
+            cls.ripple_index = (cls.ripple_index + 1) % cls.ripple_size
+
+        s.position = position
+        s.scale = 0
+        s.alpha = 1
+        # 같은 key 로 실행하면 퍼지던 물결은 멈추고 처음부터 다시 퍼짐
+        s.run_action(A.group(A.scale_to(1), A.fade_to(0)), "ripple")
+        cls.busy(0.5)
+
+    @classmethod
+    def clearRipple(cls):
+        """
+        화면이 닫힐때 물결 노드를 버리고 busy_until 을 되돌림
+        """
+        cls.ripple_list = []
+        cls.ripple_index = 0
+        cls.ripple_time = None
+        cls.busy_until = 0.0
 
     @classmethod
-    def moveLeft(cls, object, is_start: bool):
+    def moveLeft(cls, object, is_start: bool, done=None):
         """
         왼쪽으로 이동
 
@@ -280,18 +321,20 @@ class Action(Screen):
             object (Node)
             is_start: true - 오른쪽에서 나타남,
                       false - 왼쪽으로 사라짐
+            done (function): 나타나는 움직임이 끝나면 실행할 함수
         """
         x = cls.screen.size.width
         object.run_action(
             A.sequence(
                 A.move_by(x, 0, 0) if is_start else emptyFunction(),
                 A.move_by(-x, 0, 0.5),
-                emptyFunction() if is_start else A.remove(),
+                cls.__end(is_start, done),
             ),
         )
+        cls.busy(0.5)
 
     @classmethod
-    def moveRight(cls, object, is_start: bool):
+    def moveRight(cls, object, is_start: bool, done=None):
         """
         오른쪽으로 이동
 
@@ -299,15 +342,29 @@ class Action(Screen):
             object (Node)
             is_start: true - 왼쪽에서 나타남,
                       false - 오른쪽으로 사라짐
+            done (function): 나타나는 움직임이 끝나면 실행할 함수
         """
         x = cls.screen.size.width
         object.run_action(
             A.sequence(
                 A.move_by(-x, 0, 0) if is_start else emptyFunction(),
                 A.move_by(x, 0, 0.5),
-                emptyFunction() if is_start else A.remove(),
+                cls.__end(is_start, done),
             ),
         )
+        cls.busy(0.5)
+
+    @staticmethod
+    def __end(is_start, done):
+        """
+        moveLeft, moveRight 의 마지막 동작\n
+        사라지는 노드는 떼어내고, 나타나는 노드는 done 을 실행
+        """
+        if not is_start:
+            return A.remove()
+        if done is not None:
+            return A.call(done)
+        return emptyFunction()
 
 
 class ScreenRatio(Screen):
@@ -325,6 +382,90 @@ class ScreenRatio(Screen):
         """
         return self.screen.size.width < self.screen.size.height
 
+    def layout(self):
+        """
+        지금 화면 크기와 방향에 맞는 Layout 을 가져옴
+
+        Returns:
+            Layout
+        """
+        return Layout.get(self.screen.size, self.isScreenWidth())
+
+
+class Layout:
+    """
+    화면 크기와 방향에 따른 위치를 한번만 계산해두는 클래스
+
+    (크기, 방향) 별로 기억해두고 다시 같은 화면이 되면 계산하지 않고 다시 씀
+
+    Args:
+        size (숫자, 숫자): 화면 크기\n
+        is_width (bool): true - 세로, false - 가로
+    """
+
+    layouts = {}
+
+    def __init__(self, size, is_width):
+        self.size = size
+        self.is_width = is_width
+        self.points = {}
+
+        # 달력 칸 사이의 경계선, Calender.hitTest 에서 씀
+        if is_width:
+            xs, ys = Calender.height_x, Calender.height_y
+        else:
+            xs, ys = Calender.width_x, Calender.width_y
+        width, height = size
+        xs = [width * x for x in xs]
+        ys = [-height * y for y in ys[1:]]  # 아래로 갈수록 커지도록 뒤집음
+        self.x_bounds = [(a + b) / 2 for a, b in zip(xs, xs[1:])]
+        self.y_bounds = [(a + b) / 2 for a, b in zip(ys, ys[1:])]
+
+    @classmethod
+    def get(cls, size, is_width):
+        """
+        (크기, 방향) 에 맞는 Layout 을 가져옴\n
+        없다면 새로 만들어서 기억합니다
+
+        Returns:
+            Layout
+        """
+        key = (tuple(size), is_width)
+        layout = cls.layouts.get(key)
+        if layout is None:
+            layout = cls.layouts[key] = cls(key[0], is_width)
+        return layout
+
+    def point(self, position):
+        """
+        비율 위치를 화면 위치로 바꿈
+
+        Args:
+            position (숫자, 숫자): 0~1 비율
+
+        Returns:
+            (x, y) (숫자, 숫자)
+        """
+        position = tuple(position)
+        point = self.points.get(position)
+        if point is None:
+            width, height = self.size
+            point = self.points[position] = (width * position[0], height * position[1])
+        return point
+
+    def cell(self, width, height):
+        """
+        가로일때 위치와 세로일때 위치 중 맞는 것을 화면 위치로 바꿈
+
+        Args:
+            width (숫자, 숫자): 가로 x, y\n
+            height (숫자, 숫자): 세로 x, y
+
+        Returns:
+            (x, y) (숫자, 숫자)
+        """
+        return self.point(height if self.is_width else width)
+
 
 class Position(ScreenRatio):
     """
@@ -368,7 +509,7 @@ class Rectangle(Position):
         Returns:
             (x, y) (숫자, 숫자): x, y 값
         """
-        x, y = self.screen.size * self.position
+        x, y = self.layout().point(self.position)
         self.x = x - round(self.width / 2)
         self.y = y - round(self.height / 2)
         return (x, y)
@@ -384,10 +525,8 @@ class ButtonRectangle(Rectangle):
         setting (Setting): 클래스의 크기 및 모양을 결정할 정보\n
     """
 
-    object_list = []
-
     def __init__(self, sprite, position, setting):
-        x, y = self.screen.size * position
+        x, y = self.layout().point(position)
         self.sprite = SpriteNode(
             sprite, position=(x, y), color=setting.color, parent=self.screen
         )
@@ -399,7 +538,7 @@ class ButtonRectangle(Rectangle):
         width, height = self.sprite.size
         super().__init__(position, width, height)
 
-        self.object_list.append(self)
+        self.screen.button_list.append(self)
 
     def click(self, position) -> bool:
         """
@@ -426,7 +565,7 @@ class ButtonRectangle(Rectangle):
         """
         폰의 방향이 바뀔 시 실행
         """
-        for button in cls.object_list:
+        for button in cls.screen.button_list:
             x, y = button._screenPosition()
             button.sprite.position = (x, y)
 
@@ -480,15 +619,13 @@ class TextInScreen(Position):
         setting (Setting): 클래스의 크기 및 모양을 결정할 정보\n
     """
 
-    object_list = []
-
     def __init__(self, text, position, setting):
         super().__init__(position)
         self.setting = setting
         self.label = LabelNode(text, color=setting.color, parent=self.screen)
         self.__changeSize()
         self.__changePosition()
-        self.object_list.append(self)
+        self.screen.text_list.append(self)
 
     def changeText(self, text, is_bool):
         """
@@ -507,7 +644,7 @@ class TextInScreen(Position):
         """
         위치를 정렬
         """
-        x, y = self.screen.size * self.position
+        x, y = self.layout().point(self.position)
         self.label.position = (x, y)
         return (x, y)
 
@@ -526,7 +663,7 @@ class TextInScreen(Position):
         """
         폰의 방향이 바뀔 시 실행
         """
-        for text in cls.object_list:
+        for text in cls.screen.text_list:
             text.__changePosition()
 
 
@@ -554,7 +691,9 @@ class TextInCalender(Position):
         self.height_x = height_x  # 세로 x
         self.height_y = height_y  # 세로 y
 
-        self.object = LabelNode(text, parent=self.screen)
+        self.text = text
+        self.parent = None
+        self.object = SpriteNode(GlyphCache.get(text))
         self.object.size = (
             self.object.size * setting.size
             if isinstance(setting.size, (int, float))
@@ -564,16 +703,33 @@ class TextInCalender(Position):
         self.object.color = color
         self.did_change_size()
 
+    def show(self, parent):
+        """
+        parent 에 다시 붙임\n
+        움직이던 액션은 멈추고 크기, 투명도를 되돌립니다
+
+        Args:
+            parent (Node): 달력 노드
+        """
+        self.parent = parent
+        showNode(self.object, parent)
+        self.did_change_size()
+
+    def hide(self):
+        """
+        화면에서 뗌 (노드는 다시 쓰기 위해 남겨둠)
+        """
+        hideNode(self.object)
+
     def did_change_size(self):
         """
         폰의 방향이 바뀔 시 실행
 
         가로&세로 x, y 에 맞춰서 위치 지정
         """
-        if self.isScreenWidth():
-            x, y = self.screen.size * (self.height_x, self.height_y)
-        else:
-            x, y = self.screen.size * (self.width_x, self.width_y)
+        x, y = self.layout().cell(
+            (self.width_x, self.width_y), (self.height_x, self.height_y)
+        )
         self.position = (x, y)
         self.object.position = (x, y)
 
@@ -582,6 +738,9 @@ class ButtonInCalender(Circle):
     """
     달력에 클릭 가능한 글자를 뿌릴 클래스
 
+    글자 노드와 스티커 노드를 하나씩 만들어두고 바꿔가며 씁니다\n
+    다른 달을 보여줄때는 bind 로 일(day) 만 바꿉니다
+
     Args:
         num (int): 일\n
         position\n
@@ -611,21 +770,74 @@ class ButtonInCalender(Circle):
         self.width_y = width_y  # 가로 y
         self.height_x = height_x  # 세로 x
         self.height_y = height_y  # 세로 y
+        self.parent = None
+        self.label = self.__createObject(SpriteNode(GlyphCache.get(str(num))))
+        self.sticker = self.__createObject(SpriteNode(GlyphCache.sticker(Setting.complete)))
+        self.object = None
+        self.bind(num, is_active, is_sunday)
+
+    def bind(self, num, is_active, is_sunday):
+        """
+        다른 일(day) 을 보여주도록 바꿈\n
+        노드는 새로 만들지 않습니다
+
+        Args:
+            num (int): 일\n
+            is_active (bool): true 라면 스티커를 보여줌\n
+            is_sunday (bool): true 라면 일요일로 생각하고 다른색 지정\n
+        """
+        self.num = num
         self.is_active = is_active
         self.is_sunday = is_sunday
-        self.object = self.__createObject()
+
+        # 글자를 다시 그리지 않고 미리 그려둔 Texture 로 바꿈
+        texture = GlyphCache.get(str(num))
+        if self.label.texture is not texture:
+            self.label.texture = texture
+            self.label.size = texture.size
+            self.__createObject(self.label)
+        color = Setting.sunday.color if is_sunday else Setting.week.color
+        self.label.color = color
+        self.sticker.color = color
+
+        self.hide()
+        self.object = self.sticker if is_active else self.label
+
+    @property
+    def text(self) -> str:
+        """
+        칸에 보이는 일(day) 글자
+        """
+        return str(self.num)
+
+    def show(self, parent):
+        """
+        parent 에 다시 붙임\n
+        움직이던 액션은 멈추고 크기, 투명도를 되돌립니다
+
+        Args:
+            parent (Node): 달력 노드
+        """
+        self.parent = parent
+        showNode(self.object, parent)
         self.did_change_size()
 
+    def hide(self):
+        """
+        화면에서 뗌 (노드는 다시 쓰기 위해 남겨둠)
+        """
+        hideNode(self.label)
+        hideNode(self.sticker)
+
     def did_change_size(self):
         """
         폰의 방향이 바뀔 시 실행
 
         가로&세로 x, y 에 맞춰서 위치 지정
         """
-        if self.isScreenWidth():
-            x, y = self.screen.size * (self.height_x, self.height_y)
-        else:
-            x, y = self.screen.size * (self.width_x, self.width_y)
+        x, y = self.layout().cell(
+            (self.width_x, self.width_y), (self.height_x, self.height_y)
+        )
         self.position = (x, y)
         self.object.position = (x, y)
 
@@ -640,30 +852,24 @@ class ButtonInCalender(Circle):
         Returns:
             bool: 클릭 인정시 true
         """
-        isdis = self.__distance(position) <= self.radius
+        isdis = self.__distance(position) <= self.radius**2
         # 여기서 클릭 맞으면 트루리턴
         if isdis:
             self.__changeObject()
         return isdis
 
-    def __createObject(self):
+    def __createObject(self, object):
         """
-        오브젝트를 만들어냄
+        오브젝트의 크기를 정함
 
         Returns:
             Node
         """
-        if self.is_active is True:
-            object = SpriteNode(Setting.complete, parent=self.screen)
-        else:
-            object = LabelNode(str(self.num), parent=self.screen)
-
         object.size = (
             object.size * Setting.days.size
             if isinstance(Setting.days.size, (int, float))
             else Setting.days.size
         )
-        object.color = Setting.sunday.color if self.is_sunday else Setting.week.color
         return object
 
     def __changeObject(self):
@@ -674,18 +880,21 @@ class ButtonInCalender(Circle):
 
         self.is_active = not self.is_active
 
-        self.object = self.__createObject()
-        self.did_change_size()
+        self.object = self.sticker if self.is_active else self.label
+        self.show(self.parent)
         # self._screenPosition()
         Action.moveUpFadeIn(self.object)
 
     def __distance(self, position) -> float:
+        """
+        거리의 제곱 (sqrt 는 하지 않음)
+        """
         x1, y1 = self.position
         x2, y2 = position
 
         dis_x = (x2 - x1) ** 2
         dis_y = (y2 - y1) ** 2
-        return sqrt(dis_x + dis_y)
+        return dis_x + dis_y
 
 
 class Date:
@@ -709,48 +918,47 @@ class Date:
         self.year = self.date.year
         self.month = self.date.month
         self.day = self.date.day
-        startweek = date(self.year, self.month, 1)
-        self.week = startweek.weekday()
-        self.last_Day = self.__lastDay(self.year, self.month)
+        self.grid = MonthGrid.get(self.year, self.month)
+        self.week, self.last_Day = self.grid.week, self.grid.last_day
 
     def nextMonth(self):
         """
         date 의 다음달
         """
-        self.date += relativedelta(months=1)
-        self.reset()
+        self.moveMonth(1)
 
-    def previousMonth(self):
+    def moveMonth(self, months):
         """
-        date 의 전달
+        date 를 months 달 만큼 옮김
+
+        Args:
+            months (int): 음수라면 이전 달로
         """
-        self.date -= relativedelta(months=1)
+        year, month = shiftMonth(self.year, self.month, months)
+        # 옮긴 달에 없는 날짜라면 마지막날로 (1월 31일 -> 2월 28일)
+        self.date = date(year, month, min(self.day, lastDay(year, month)))
         self.reset()
 
-    def __lastDay(self, year, month):
+    def previousMonth(self):
         """
-        해당 월의 마지막날 구함
-
-        Returns:
-            int
+        date 의 전달
         """
-        month += 1
-        if month == 13:
-            month = 1
-            year += 1
-        d = date(year, month, 1) - relativedelta(days=1)
-        return d.day
+        self.moveMonth(-1)
 
 
-class Calender(Screen):
+class Calender(ScreenRatio):
     """
     달력 클래스
 
     이 클래스 기반으로 글자와 글자위치 정함
 
+    요일 7칸과 날짜 7x6 칸을 한번만 만들고
+    다른 달은 bind 로 칸의 글자와 스티커만 바꿔서 보여줌\n
+    모든 칸은 node 하나에 붙어있어서 달력을 움직일때는 node 만 움직임
+
     Args:
         date_class (Data)\n
-        data_list (list): 데이터가 들어있는 리스트\n
+        data_list (MonthBits): 데이터가 들어있는 리스트\n
 
     data_list 안에 있는 정보와 일(day) 일치하면 체크
     없다면 체크아님
@@ -761,19 +969,26 @@ class Calender(Screen):
     width_x = (0.29, 0.36, 0.43, 0.5, 0.57, 0.64, 0.71)
     width_y = (0.6, 0.51, 0.42, 0.33, 0.24, 0.15, 0.06)
 
+    rows = 6
+
     def __init__(self, date_class, data_list):
         self.object_list = []
+        self.week_list = []
+        self.day_list = []
         self.date = date_class
+        self.node = Node(parent=self.screen)
 
-        self.__createCalender(data_list)
+        self.__createCalender()
+        self.bind(date_class, data_list)
 
-    def __createCalender(self, data_list):
+    def __createCalender(self):
         """
         직접 글자를 그리는 함수
 
-        Args:
-            data_list (list)
+        요일과 날짜 칸을 모두 만들어 둠\n
+        글자와 스티커는 GlyphCache 에 한번만 그려둡니다
         """
+        GlyphCache.prerender(self.date._weekday, Setting.complete)
         y = 0
         # 월화수목금토일
         for x, week in enumerate(self.date._weekday):
@@ -788,30 +1003,67 @@ class Calender(Screen):
                 setting=Setting.week,
                 is_sunday=is_sunday,
             )
-            self.object_list.append(object)
+            self.week_list.append(object)
 
-        y += 1
-        x = self.date.week
         # 1, 2, 3, 4, 5 .....
-        for day in range(1, self.date.last_Day + 1):
-            is_active = day in data_list
-            is_sunday = x == 6
-            object = ButtonInCalender(
-                num=day,
-                position=(0, 0),  # 어차피 들어가서 입력됨
-                radius=25,
-                width_x=self.width_x[x],
-                width_y=self.width_y[y],
-                height_x=self.height_x[x],
-                height_y=self.height_y[y],
-                is_active=is_active,
-                is_sunday=is_sunday,
-            )
+        for y in range(1, self.rows + 1):
+            for x in range(7):
+                object = ButtonInCalender(
+                    num=0,
+                    position=(0, 0),  # 어차피 들어가서 입력됨
+                    radius=25,
+                    width_x=self.width_x[x],
+                    width_y=self.width_y[y],
+                    height_x=self.height_x[x],
+                    height_y=self.height_y[y],
+                    is_active=False,
+                    is_sunday=x == 6,
+                )
+                self.day_list.append(object)
+
+    def bind(self, date_class, data_list):
+        """
+        다른 달을 보여주도록 칸들을 바꿈
+
+        Args:
+            date_class (Data)\n
+            data_list (MonthBits)
+        """
+        self.date = date_class
+        # date_class 는 다음 달로 바뀌므로 그린 달의 칸 배치는 따로 기억
+        self.grid = date_class.grid
+        showNode(self.node, self.screen)
+        self.node.position = (0, 0)
+        for obj in self.object_list:
+            obj.hide()
+
+        self.object_list = list(self.week_list)
+        # 1, 2, 3, 4, 5 .....
+        for day in range(1, self.grid.last_day + 1):
+            index = self.grid.indexes[day]
+            object = self.day_list[index]
+            object.bind(day, day in data_list, index % 7 == 6)
             self.object_list.append(object)
-            x += 1
-            if 7 <= x:
-                x = 0
-                y += 1
+
+        for obj in self.object_list:
+            obj.show(self.node)
+        self.__createIndex()
+
+    def hitTest(self, position):
+        """
+        클릭 위치에 있는 날짜 칸을 바로 찾음
+
+        Args:
+            position
+
+        Returns:
+            ButtonInCalender: 이번달 칸이 아니라면 None
+        """
+        x, y = position
+        index = bisect(self.y_bounds, -y) * 7 + bisect(self.x_bounds, x)
+        if not self.grid.day(index):
+            return None
+        return self.day_list[index]
 
     def did_change_size(self):
         """
@@ -819,6 +1071,16 @@ class Calender(Screen):
         """
         for obj in self.object_list:
             obj.did_change_size()
+        self.__createIndex()
+
+    def __createIndex(self):
+        """
+        화면 크기와 방향에 맞는 칸과 칸 사이 경계선을 Layout 에서 가져옴\n
+        hitTest 에서 경계선으로 몇번째 줄, 칸인지 찾습니다
+        """
+        layout = self.layout()
+        self.x_bounds = layout.x_bounds
+        self.y_bounds = layout.y_bounds
 
 
 class CalenderController:
@@ -827,11 +1089,14 @@ class CalenderController:
 
     Args:
         date_class (Data)\n
-        data_list (list): 데이터가 들어있는 리스트\n
+        data_list (MonthBits): 데이터가 들어있는 리스트\n
     """
 
     def __init__(self, date_class, data_list):
         self.calender = None
+        self.spare = None  # 화면 밖으로 나간 달력, 다음에 다시 씀
+        self.is_moving = False  # 달력이 넘어가는 중인지
+        self.pending = 0  # 넘어가는 중에 들어온 이동 요청 (달 수)
 
         self.create(date_class, data_list)
 
@@ -841,7 +1106,7 @@ class CalenderController:
 
         Args:
             date_class (Data)\n
-            data_list (list): 데이터가 들어있는 리스트\n
+            data_list (MonthBits): 데이터가 들어있는 리스트\n
         """
         self.calender = Calender(date_class, data_list)
 
@@ -851,15 +1116,9 @@ class CalenderController:
 
         Args:
             date_class (Data)\n
-            data_list (list): 데이터가 들어있는 리스트\n
+            data_list (MonthBits): 데이터가 들어있는 리스트\n
         """
-        for obj in self.calender.object_list:
-            Action.moveLeft(obj.object, False)
-
-        self.calender = Calender(date_class, data_list)
-
-        for obj in self.calender.object_list:
-            Action.moveLeft(obj.object, True)
+        self.move(1, date_class, data_list)
 
     def previousMonth(self, date_class, data_list):
         """
@@ -867,15 +1126,68 @@ class CalenderController:
 
         Args:
             date_class (Data)\n
-            data_list (list): 데이터가 들어있는 리스트\n
+            data_list (MonthBits): 데이터가 들어있는 리스트\n
         """
-        for obj in self.calender.object_list:
-            Action.moveRight(obj.object, False)
+        self.move(-1, date_class, data_list)
 
-        self.calender = Calender(date_class, data_list)
+    def request(self, months) -> bool:
+        """
+        달력이 넘어가는 중이라면 이동 요청을 모아둠\n
+        모아둔 요청은 넘어가기가 끝난 뒤 한번에 이동합니다
 
-        for obj in self.calender.object_list:
-            Action.moveRight(obj.object, True)
+        Args:
+            months (int): 1 - 다음달, -1 - 전달
+
+        Returns:
+            true - 모아둠 (지금 이동하면 안됨)\n
+            false - 바로 이동해도 됨
+        """
+        if self.is_moving:
+            self.pending += months
+        return self.is_moving
+
+    def move(self, months, date_class, data_list, done=None):
+        """
+        months 달 만큼 넘어간 달력으로 바꿈\n
+        양수라면 왼쪽으로, 음수라면 오른쪽으로 넘어갑니다
+
+        Args:
+            months (int)\n
+            date_class (Data)\n
+            data_list (MonthBits): 데이터가 들어있는 리스트\n
+            done (function): 넘어가기가 끝나면 모아둔 요청 (달 수) 을 받는 함수
+        """
+        move = Action.moveLeft if 0 < months else Action.moveRight
+        self.is_moving = True
+        move(self.calender.node, False)
+        self.__swap(date_class, data_list)
+        move(self.calender.node, True, lambda: self.__moved(done))
+
+    def __moved(self, done):
+        """
+        넘어가기가 끝나면 모아둔 요청을 done 으로 넘김
+        """
+        self.is_moving = False
+        months, self.pending = self.pending, 0
+        if months and done is not None:
+            done(months)
+
+    def __swap(self, date_class, data_list):
+        """
+        나가는 달력과 남아있던 달력을 바꿔서 다시 씀\n
+        처음 한번만 새 달력을 만듭니다
+
+        Args:
+            date_class (Data)\n
+            data_list (MonthBits): 데이터가 들어있는 리스트\n
+        """
+        calender = self.spare
+        self.spare = self.calender
+        if calender is None:
+            self.calender = Calender(date_class, data_list)
+        else:
+            calender.bind(date_class, data_list)
+            self.calender = calender
 
 
 class DataUI(Scene):
@@ -890,8 +1202,51 @@ class DataUI(Scene):
         Screen.screen = self
         self.date = Date(date.today())
         self.dataController = DataController(self.date)
+        self.stats = self.dataController.stats
         data_list = self.dataController.data
         self.calenderController = CalenderController(self.date, data_list)
+        self.latency = self.__createLatency()
+        self.prefetcher = Prefetcher(self.__prefetch)
+        self._prefetchAround()
+
+    def stop(self):
+        self.prefetcher.close()
+        try:
+            self.dataController.close()
+        finally:
+            self.latency.dump()
+
+    def _prefetchAround(self):
+        """
+        지금 보는 달의 다음달, 전달을 백그라운드에서 미리 준비\n
+        이전에 요청한 달은 취소됩니다
+        """
+        year, month = self._getYearMonth()
+        index = year * 12 + month - 1
+        self.prefetcher.request([(i // 12, i % 12 + 1) for i in (index + 1, index - 1)])
+
+    def __prefetch(self, year, month):
+        """
+        Prefetcher 쓰레드에서 실행
+        """
+        self.dataController.preload(year)
+        MonthGrid.get(year, month)
+
+    def __createLatency(self):
+        """
+        option 에서 측정을 켰다면 Latency, 아니라면 아무것도 안하는 NoLatency
+
+        Returns:
+            Latency
+        """
+        if not Setting.latency:
+            return NoLatency()
+
+        latency = Latency(Setting.latency_callback)
+        queue = getattr(self.dataController.storage, "queue", None)
+        if queue is not None:
+            queue.listener = lambda seconds: latency.add("persist", seconds)
+        return latency
 
     def _getYearMonth(self):
         """
@@ -908,10 +1263,16 @@ class ScreenUI(DataUI):
     직접 화면에 보이는 클래스
 
     각종 글자와 버튼 생성
+
+    버튼과 글자 목록은 화면마다 따로 가지고 stop 에서 비웁니다
     """
 
+    idle_delay = 0.1  # 액션이 끝나거나 깨어난 뒤 멈추지 않고 기다릴 시간 (초)
+
     def setup(self):
         super().setup()
+        self.button_list = []  # ButtonRectangle 목록
+        self.text_list = []  # TextInScreen 목록
         TextInScreen(self.title, (0.5, 0.9), Setting.title)
         year, month = self._getYearMonth()
         self.year_month = TextInScreen(f"{year}/{month}", (0.5, 0.8), Setting.yearMonth)
@@ -928,16 +1289,53 @@ class ScreenUI(DataUI):
             sprite="typw:Right",
             position=(0.9, 0.8),
         )
+        self.wake()
+
+    def did_evaluate_actions(self):
+        """
+        매 프레임 액션을 실행한 뒤 실행
+
+        움직이는 액션이 없다면 화면을 멈춰서 프레임을 그리지 않음 (배터리 절약)\n
+        액션이 끝날때 새 액션을 시작할 수 있으므로 update 가 아닌 여기서 확인합니다\n
+        터치하거나 화면 크기가 바뀌면 wake 로 다시 움직입니다
+        """
+        if Setting.idle and Action.isIdle(self.idle_delay):
+            self.paused = True
+
+    def wake(self):
+        """
+        멈춘 화면을 다시 움직임\n
+        바뀐 글자가 그려지도록 idle_delay 동안은 멈추지 않습니다
+        """
+        self.paused = False
+        Action.busy(0)
 
     def did_change_size(self):
         """
         폰의 방향이 바뀔 시 실행
         """
         super().did_change_size()
+        self.wake()
         ButtonRectangle.did_change_size()
         TextInScreen.did_change_size()
         self.calenderController.calender.did_change_size()
 
+    def stop(self):
+        """
+        화면이 닫힐때 실행
+
+        버튼과 글자 목록, 물결 노드를 비우고 Screen.screen 이 이 화면을 붙잡지 않게 함
+        """
+        # 저장에 실패해서 super().stop() 이 raise 해도 화면은 놓아줌
+        try:
+            super().stop()
+        finally:
+            self.button_list.clear()
+            self.text_list.clear()
+            Action.clearRipple()
+            if Screen.screen is self:
+                Screen.screen = None
+
     def __createBtn(self, sprite: str, position):
         """
         ButtonRectangle 클래스 생성
@@ -967,35 +1365,62 @@ class TouchUI(ScreenUI):
         Args:
             touch: touch.location 으로 클릭위치 받음
         """
+        latency = self.latency
+        start = latency.time()
+        self.wake()
         Action.screenClick(self, touch.location)
         year, month = self._getYearMonth()
 
         if self.left_btn.click(touch.location):
-            self.dataController.save(year, month)
-            self.date.previousMonth()
-            year, month = self._getYearMonth()
-            self.dataController.open(year, month)
-            data_list = self.dataController.data
-            self.calenderController.previousMonth(self.date, data_list)
-            self.__textUpdate(True)
+            self.__navigate(-1)
             return
 
         if self.right_btn.click(touch.location):
-            self.dataController.save(year, month)
-            self.date.nextMonth()
-            year, month = self._getYearMonth()
-            self.dataController.open(year, month)
-            data_list = self.dataController.data
-            self.calenderController.nextMonth(self.date, data_list)
-            self.__textUpdate(True)
+            self.__navigate(1)
+            return
+
+        t = latency.time()
+        obj = self.calenderController.calender.hitTest(touch.location)
+        latency.record("hit", t)
+        if obj is None:
             return
 
-        for obj in self.calenderController.calender.object_list:
-            if isinstance(obj, ButtonInCalender):
-                if obj.click(touch.location):
-                    self.dataController.commit(obj.is_active, obj.num, year, month)
-                    self.__textUpdate(False)
-                    break
+        t = latency.time()
+        if not obj.click(touch.location):
+            return
+        latency.record("swap", t)
+
+        t = latency.time()
+        self.dataController.commit(obj.is_active, obj.num, year, month)
+        latency.record("commit", t)
+
+        t = latency.time()
+        self.__textUpdate(False)
+        latency.record("text", t)
+        latency.record("total", start)
+
+    def __navigate(self, months):
+        """
+        months 달 만큼 달력을 넘김\n
+        넘어가는 중에 누른 버튼은 모아두었다가 끝난 뒤 마지막 달로 한번에 넘어갑니다
+
+        Args:
+            months (int): 1 - 다음달, -1 - 전달
+        """
+        if self.calenderController.request(months):
+            # 어디로 갈지 아직 모르므로 미리 준비하던 달은 버림
+            self.prefetcher.cancel()
+            return
+
+        year, month = self._getYearMonth()
+        self.dataController.save(year, month)
+        self.date.moveMonth(months)
+        year, month = self._getYearMonth()
+        self.dataController.open(year, month)
+        data_list = self.dataController.data
+        self.calenderController.move(months, self.date, data_list, self.__navigate)
+        self._prefetchAround()
+        self.__textUpdate(True)
 
     def __textUpdate(self, is_bool):
         year, month = self._getYearMonth()
@@ -1044,6 +1469,13 @@ goal.option.폰방향.가로
 goal.option.폰방향.세로
 
 
+-- 저장 방식을 선택합니다
+ex)
+goal.option.저장소.기본
+goal.option.저장소.비트맵
+goal.option.저장소.데이터베이스
+
+
 -- 달력의 스티커를 지정할 수 있습니다
 자세한 정보들은 키보드 위 + 버튼 클릭
 기본: "typw:Check"
@@ -1082,7 +1514,7 @@ goal.option.년월.사이즈 = (20, 20)
     if title is None:
         title = os.path.splitext(os.path.basename(sys.argv[0]))[0]
 
-    run(Goal(title), Setting.orientation)
+    return run(Goal(title), Setting.orientation)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,386 @@
+"""
+성능 측정 모음
+
+headless 모듈로 화면 없이 달력 넘기기, 날짜 누르기, 화면 돌리기와
+저장소 (1, 10, 50 년치 기록) 를 측정해서 json 으로 저장합니다
+
+    python -m goal.bench -o baseline.json
+    python -m goal.bench -c baseline.json
+"""
+
+import os, sys, json, time, random, argparse, platform, tempfile, subprocess, tracemalloc
+from datetime import date
+
+from . import headless
+from .headless import Stats, HeadlessView
+from .option import Setting
+from .storage import createStorage, File, BitmapFile
+
+
+YEARS = (1, 10, 50)
+STORAGES = ("json", "bitmap", "sqlite")
+# import goal 만으로는 불러오면 안되는 모듈
+HEAVY = ("scene", "ui", "dateutil", "goal.app", "PIL", "sqlite3", "numpy")
+
+
+def measure(func, number, repeat=3) -> dict:
+    """
+    func 를 number 번씩 repeat 번 실행해서 가장 빠른 1회 시간을 구함\n
+    마지막에 한번 더 실행하면서 메모리와 노드, 액션 개수를 셉니다
+
+    Args:
+        func (function): 한번 실행할 함수\n
+        number (int)\n
+        repeat (int)
+
+    Returns:
+        dict: seconds, memory, nodes, actions, frames (모두 1회 기준)
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        seconds = (time.perf_counter() - start) / number
+        best = seconds if best is None else min(best, seconds)
+
+    Stats.reset()
+    tracemalloc.start()
+    for _ in range(number):
+        func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": best,
+        "memory": peak,
+        "nodes": sum(Stats.created.values()) / number,
+        "actions": Stats.actions / number,
+        "frames": Stats.frames / number,
+    }
+
+
+class Scenario:
+    """
+    headless 로 Goal 을 띄워두는 클래스
+
+    Args:
+        path (str): 저장할 위치
+    """
+
+    def __init__(self, path):
+        from .app import Goal
+
+        if not issubclass(Goal, headless.Scene):
+            raise RuntimeError("scene 모듈이 없는 환경에서 실행해야 함")
+
+        argv, sys.argv = sys.argv, [os.path.join(path, "bench.py")]
+        try:
+            self.scene = Goal("bench")
+            self.view = HeadlessView(self.scene, (375, 667))
+        finally:
+            sys.argv = argv
+        self.direction = 1
+
+    def flip(self):
+        """
+        다음달, 전달을 번갈아 누르고 애니메이션을 끝냄
+        """
+        button = self.scene.right_btn if self.direction > 0 else self.scene.left_btn
+        self.direction = -self.direction
+        self.view.touch(button.sprite.position)
+        self.view.advance(0.6)
+
+    def burst(self, count=5):
+        """
+        다음달 (또는 전달) 을 애니메이션 중에 count 번 빠르게 누르고 끝냄
+        """
+        button = self.scene.right_btn if self.direction > 0 else self.scene.left_btn
+        self.direction = -self.direction
+        for _ in range(count):
+            self.view.touch(button.sprite.position)
+            self.view.advance(0.06)
+        self.view.advance(1.2)
+
+    def idle(self):
+        """
+        아무것도 누르지 않고 1초를 보냄 (멈춘 화면은 프레임을 그리지 않음)
+        """
+        self.view.advance(1.0)
+
+    def tap(self):
+        """
+        이번달 첫날을 누름
+        """
+        calender = self.scene.calenderController.calender
+        cell = calender.day_list[calender.date.week]
+        self.view.touch(cell.position)
+
+    def rotate(self):
+        """
+        화면을 가로, 세로로 번갈아 돌림
+        """
+        width, height = self.scene.size
+        self.view.resize((height, width))
+
+    def close(self):
+        self.view.stop()
+
+
+def fill(kind, path, years, today):
+    """
+    저장소에 years 년치 기록을 채움 (하루 걸러 하루 꼴로 무작위 체크)
+
+    Returns:
+        str: DataController 에 넘길 파일 위치
+    """
+    rng = random.Random(years)
+    script = os.path.join(path, f"{kind}{years}.py")
+    storage = createStorage(kind, path, f"{kind}{years}")
+    first = today.year - years + 1
+
+    if isinstance(storage, File):
+        for year in range(first, today.year + 1):
+            data = {
+                str(month): sorted(rng.sample(range(1, 29), 14))
+                for month in range(1, 12 + 1)
+            }
+            storage.write(year, data)
+    else:
+        records = [
+            (year, month, day, True)
+            for year in range(first, today.year + 1)
+            for month in range(1, 12 + 1)
+            for day in rng.sample(range(1, 29), 14)
+        ]
+        if isinstance(storage, BitmapFile):
+            for record in records:
+                storage.set(*record)
+        else:
+            storage.extend(records)
+    storage.close()
+    return script
+
+
+def runStorage(path, today) -> dict:
+    """
+    저장소 종류, 기록 길이별로 commit, save, open, count, 통계를 측정
+    """
+    from .app import DataController, Date
+
+    results = {}
+    storage = Setting.storage
+    try:
+        for kind in STORAGES:
+            Setting.storage = kind
+            for years in YEARS:
+                script = fill(kind, path, years, today)
+                controller = DataController(Date(today), script)
+                first = date(today.year - years + 1, 1, 1)
+                name = f"storage.{kind}.{years}y"
+                state = {"day": 0, "month": 0}
+
+                def commit():
+                    state["day"] = state["day"] % 28 + 1
+                    day = state["day"]
+                    is_bool = day not in controller.data
+                    controller.commit(is_bool, day, today.year, today.month)
+
+                def flush():
+                    commit()
+                    controller.flush()
+
+                def save():
+                    commit()
+                    controller.save(today.year, today.month)
+
+                def open_():
+                    # 매번 캐시를 비우고 다른 년도를 읽음
+                    state["month"] += 1
+                    controller.cache.clear()
+                    year = first.year + state["month"] % years
+                    controller.open(year, state["month"] % 12 + 1)
+
+                def count():
+                    controller.storage.count(first, today)
+
+                def stats():
+                    # 체크 하나를 반영하고 통계를 다시 구함
+                    commit()
+                    controller.stats.summary(today)
+
+                results[f"{name}.commit"] = measure(commit, 200)
+                results[f"{name}.flush"] = measure(flush, 5)
+                results[f"{name}.save"] = measure(save, 20)
+                results[f"{name}.open"] = measure(open_, 20)
+                results[f"{name}.count"] = measure(count, 5)
+                controller.stats.load()
+                results[f"{name}.stats"] = measure(stats, 50)
+                controller.open(today.year, today.month)
+                controller.close()
+    finally:
+        Setting.storage = storage
+    return results
+
+
+def runUI(path) -> dict:
+    """
+    달력 넘기기, 날짜 누르기, 화면 돌리기를 측정
+    """
+    from .check_launch import checkLaunch
+
+    checkLaunch(path)
+
+    def launch():
+        Scenario(path).close()
+
+    # 화면은 한번에 하나만 띄울 수 있으므로 먼저 측정
+    results = {"ui.launch": measure(launch, 5)}
+    scenario = Scenario(path)
+    try:
+        results.update({
+            "ui.flip": measure(scenario.flip, 20),
+            "ui.burst": measure(scenario.burst, 10),
+            "ui.tap": measure(scenario.tap, 50),
+            "ui.rotate": measure(scenario.rotate, 50),
+            "ui.idle": measure(scenario.idle, 5),
+        })
+    finally:
+        scenario.close()
+    return results
+
+
+def importTime(code, module, forbidden, repeat=5) -> dict:
+    """
+    새 python 에서 code 를 실행해서 module 을 불러오는 시간을 측정 (-X importtime)\n
+    forbidden 모듈이 불러와졌다면 RuntimeError
+
+    Args:
+        code (str): 실행할 import 문\n
+        module (str): 시간을 잴 모듈\n
+        forbidden (tuple): 불러오면 안되는 모듈
+
+    Returns:
+        dict: 측정값 (seconds 만 있음)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH")))))
+    code = f"import sys\n{code}\nprint(','.join(m for m in {forbidden!r} if m in sys.modules))"
+
+    times = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        loaded = process.stdout.strip()
+        if loaded:
+            raise RuntimeError(f"{module} 에서 불러오면 안되는 모듈: {loaded}")
+        for line in process.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                times.append(int(fields[1]) / 1e6)
+
+    return {"seconds": min(times), "memory": 0, "nodes": 0, "actions": 0, "frames": 0}
+
+
+def runImport() -> dict:
+    """
+    import goal 은 HEAVY 모듈 없이, goal.app 은 dateutil 없이 불러와지는지 확인하고 시간을 측정
+    """
+    return {
+        "import.goal": importTime("import goal, goal.storage, goal.stats", "goal", HEAVY),
+        "import.app": importTime("import goal.app", "goal.app", ("dateutil", "PIL", "sqlite3", "numpy")),
+    }
+
+
+def run(storage=True, ui=True, imports=True) -> dict:
+    """
+    측정을 모두 실행
+
+    Returns:
+        dict: {"meta": 환경 정보, "results": {이름: 측정값}}
+    """
+    today = date.today()
+    help, Setting.help = Setting.help, False
+    results = {}
+    try:
+        if imports:
+            results.update(runImport())
+        with tempfile.TemporaryDirectory() as path:
+            if ui:
+                results.update(runUI(path))
+            if storage:
+                results.update(runStorage(path, today))
+    finally:
+        Setting.help = help
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": today.isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=0.25) -> list:
+    """
+    기준값보다 threshold 비율 이상 느려지거나 커진 항목을 찾음
+
+    Args:
+        baseline (dict): 이전에 저장한 run 결과\n
+        current (dict): 이번 run 결과\n
+        threshold (float): 0.25 라면 25% 이상 나빠진 것만
+
+    Returns:
+        list: [(이름, 항목, 기준값, 이번값), ...]
+    """
+    regressions = []
+    for name, old in baseline["results"].items():
+        new = current["results"].get(name)
+        if new is None:
+            continue
+        for key in ("seconds", "memory", "nodes", "actions", "frames"):
+            if key not in old or key not in new:
+                continue
+            if old[key] * (1 + threshold) < new[key] and 0 < new[key] - old[key]:
+                regressions.append((name, key, old[key], new[key]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m goal.bench")
+    parser.add_argument("-o", "--output", help="결과를 저장할 json 파일")
+    parser.add_argument("-c", "--compare", help="비교할 기준 json 파일")
+    parser.add_argument("-t", "--threshold", type=float, default=0.25)
+    parser.add_argument("--no-storage", action="store_true")
+    parser.add_argument("--no-ui", action="store_true")
+    parser.add_argument("--no-import", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = run(storage=not args.no_storage, ui=not args.no_ui, imports=not args.no_import)
+    for name, value in sorted(result["results"].items()):
+        print(
+            f"{name:32} {value['seconds'] * 1e6:12.1f} us"
+            f" {value['memory'] / 1024:10.1f} KiB"
+            f" {value['nodes']:6.1f} nodes {value['actions']:6.1f} actions"
+            f" {value['frames']:6.1f} frames"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.threshold)
+        for name, key, old, new in regressions:
+            print(f"느려짐: {name} {key} {old:.6g} -> {new:.6g}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
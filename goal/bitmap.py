@@ -0,0 +1,91 @@
+class MonthBits:
+    """
+    한달의 체크 정보를 31비트 정수 하나로 가지는 클래스
+
+    1일은 0번 비트, 31일은 30번 비트\n
+    추가, 삭제, 확인이 O(1) 이고 len 은 켜진 비트 개수 입니다
+
+    Args:
+        days (list): 체크된 일(day) 리스트
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, days=()):
+        self.bits = 0
+        for day in days:
+            self.bits |= 1 << (day - 1)
+
+    def add(self, day):
+        """
+        day 를 체크
+        """
+        self.bits |= 1 << (day - 1)
+
+    def discard(self, day):
+        """
+        day 를 체크 해제
+        """
+        self.bits &= ~(1 << (day - 1))
+
+    def __contains__(self, day) -> bool:
+        return bool(self.bits >> (day - 1) & 1)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length()
+            bits ^= low
+
+    def __eq__(self, other):
+        if isinstance(other, MonthBits):
+            return self.bits == other.bits
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MonthBits({list(self)})"
+
+    @property
+    def days(self) -> tuple:
+        """
+        체크된 일(day) 을 순서대로 담은 읽기 전용 리스트
+        """
+        return tuple(self)
+
+
+def emptyYear() -> dict:
+    """
+    체크가 하나도 없는 일년치 데이터
+
+    Returns:
+        dict: {"월": MonthBits}
+    """
+    return {str(month): MonthBits() for month in range(1, 12 + 1)}
+
+
+def fold(data, changes) -> dict:
+    """
+    (월, {일: bool}) 변경사항을 일년치 데이터에 덮어씀\n
+    Journal, SaveQueue 가 아직 저장소에 들어가지 않은 기록을 반영할때 씁니다
+
+    Args:
+        data (dict): {"월": MonthBits}, 그대로 바뀝니다\n
+        changes (list): [(월, {일: bool}), ...] 오래된 기록부터
+
+    Returns:
+        dict: data
+    """
+    for month, days in changes:
+        bits = data[str(month)]
+        for day, is_bool in days.items():
+            if is_bool:
+                bits.add(day)
+            else:
+                bits.discard(day)
+    return data
@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+
+
+class YearCache:
+    """
+    읽어온 년도 데이터를 기억하는 클래스
+
+    가장 오래 안쓴 년도부터 지웁니다 (LRU)\n
+    hits, misses 로 캐시 효과를 확인할 수 있습니다\n
+    get 과 clear 는 미리 읽는 쓰레드에서 불러도 됩니다\n
+    읽는 동안에는 lock 을 놓으므로 다른 년도는 기다리지 않고 가져갑니다
+
+    Args:
+        size (int): 기억할 년도의 개수
+    """
+
+    def __init__(self, size=3):
+        self.size = size
+        self.years = OrderedDict()  # {년: {"월": [일, ...]}}
+        self.dirty = set()  # 스냅샷에 저장되지 않은 (년, 월)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+        self.loading = {}  # 읽는 중인 년도 {년: threading.Event}
+        self.generation = 0  # clear 할때마다 늘어남 (clear 전에 읽던 데이터는 기억하지 않음)
+
+    def get(self, year, load) -> dict:
+        """
+        년도 데이터를 가져옴\n
+        없다면 load 로 읽어온 후 기억합니다
+
+        Args:
+            year (int)\n
+            load (function): year 를 받아 데이터를 리턴하는 함수
+
+        Returns:
+            dict: {"월": [일, ...]}
+        """
+        with self.lock:
+            if year in self.years:
+                self.hits += 1
+                self.years.move_to_end(year)
+                return self.years[year]
+
+            # 같은 년도를 두번 읽지 않도록 먼저 읽기 시작한 쓰레드만 읽음
+            event = self.loading.get(year)
+            if event is None:
+                event = self.loading[year] = threading.Event()
+                generation = self.generation
+                self.misses += 1
+            else:
+                generation = None
+
+        if generation is None:
+            event.wait()
+            return self.get(year, load)  # 읽기에 실패했다면 이 쓰레드가 다시 읽음
+
+        try:
+            data = load(year)
+            with self.lock:
+                if generation == self.generation:
+                    self.years[year] = data
+                    while self.size < len(self.years):
+                        self.years.popitem(last=False)
+            return data
+        finally:
+            with self.lock:
+                del self.loading[year]
+            event.set()
+
+    def peek(self, year) -> bool:
+        """
+        year 를 기억하고 있는지 확인 (hits, misses 는 세지 않음)
+        """
+        with self.lock:
+            return year in self.years
+
+    def markDirty(self, year, month):
+        """
+        (년, 월) 이 바뀌었다고 표시
+        """
+        self.dirty.add((year, month))
+
+    def isDirty(self, year, month) -> bool:
+        return (year, month) in self.dirty
+
+    def clean(self, year, month):
+        """
+        (년, 월) 이 저장되었다고 표시
+        """
+        self.dirty.discard((year, month))
+
+    def clear(self):
+        """
+        기억한 데이터를 모두 지움
+        """
+        with self.lock:
+            self.years.clear()
+            self.generation += 1
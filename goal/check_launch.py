@@ -0,0 +1,75 @@
+"""
+여러번 띄우고 닫아도 화면 객체가 남지 않는지 확인
+
+headless 모듈로 Goal 을 number 번 띄우고 눌러본 뒤 닫습니다\n
+버튼, 글자 목록, 물결 노드 개수가 늘거나 닫은 화면이 남아있다면 1 로 끝납니다
+
+    python -m goal.check_launch
+    python -m goal.check_launch -n 50
+"""
+
+import gc, sys, argparse, tempfile
+
+from .option import Setting
+from .bench import Scenario
+
+
+def checkLaunch(path, number=10, taps=8) -> dict:
+    """
+    여러번 띄우고 닫아도 버튼, 글자 목록, 물결 노드와 남아있는 화면 개수가 늘지 않는지 확인
+
+    Args:
+        path (str): 저장할 위치\n
+        number (int): 띄울 횟수\n
+        taps (int): 화면마다 빈 곳을 누를 횟수 (물결 노드를 만듦)
+
+    Returns:
+        dict: buttons, texts (화면 하나의 목록 길이), ripples (화면 하나의 최대 물결 노드),
+              alive (닫은 뒤 남아있는 화면)
+    """
+    from .app import Goal, Action
+
+    counts = set()
+    for _ in range(number):
+        scenario = Scenario(path)
+        scene = scenario.scene
+        for _ in range(taps):
+            scenario.view.touch((5, 5))
+            scenario.view.advance(0.1)
+        counts.add((len(scene.button_list), len(scene.text_list), len(Action.ripple_list)))
+        scenario.close()
+        if Action.ripple_list:
+            raise RuntimeError(f"화면을 닫아도 물결 노드가 남음: {len(Action.ripple_list)}")
+    del scenario, scene
+
+    gc.collect()
+    alive = sum(1 for o in gc.get_objects() if isinstance(o, Goal))
+    if len(counts) != 1 or alive:
+        raise RuntimeError(f"화면을 닫아도 남는 객체가 있음: {counts}, {alive}")
+    ((buttons, texts, ripples),) = counts
+    if Action.ripple_size < ripples:
+        raise RuntimeError(f"물결 노드가 ripple_size 보다 많음: {ripples}")
+    return {"buttons": buttons, "texts": texts, "ripples": ripples, "alive": alive}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m goal.check_launch")
+    parser.add_argument("-n", "--number", type=int, default=10, help="띄울 횟수")
+    args = parser.parse_args(argv)
+
+    help, Setting.help = Setting.help, False
+    try:
+        with tempfile.TemporaryDirectory() as path:
+            result = checkLaunch(path, args.number)
+    except RuntimeError as e:
+        print(f"실패: {e}")
+        return 1
+    finally:
+        Setting.help = help
+
+    print(", ".join(f"{key}: {value}" for key, value in result.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
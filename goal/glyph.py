@@ -0,0 +1,90 @@
+try:
+    from scene import Texture
+except ImportError:
+    from .headless import Texture
+
+
+class GlyphCache:
+    """
+    달력에 쓰는 글자와 스티커를 한번만 그려서 Texture 로 나눠주는 클래스
+
+    글자는 흰색으로 그려두고 SpriteNode.color 로 색을 입힙니다\n
+    같은 글자, 같은 글꼴이라면 같은 Texture 를 돌려줍니다
+    """
+
+    font = ("Helvetica", 20)  # LabelNode 의 기본 글꼴
+    textures = {}  # {(글자, 글꼴): Texture}
+    stickers = {}  # {스티커 이름: Texture}
+    renders = 0  # 실제로 그린 횟수
+
+    @classmethod
+    def get(cls, text, font=None) -> Texture:
+        """
+        글자를 그린 Texture 를 가져옴\n
+        없다면 그린 후 기억합니다
+
+        Args:
+            text (str)\n
+            font (str, 숫자): 없다면 기본 글꼴
+
+        Returns:
+            Texture
+        """
+        key = (text, font or cls.font)
+        texture = cls.textures.get(key)
+        if texture is None:
+            texture = cls.textures[key] = cls.__render(*key)
+        return texture
+
+    @classmethod
+    def sticker(cls, name) -> Texture:
+        """
+        스티커 이미지의 Texture 를 가져옴
+
+        Args:
+            name (str): option 의 스티커 이름
+        """
+        texture = cls.stickers.get(name)
+        if texture is None:
+            texture = cls.stickers[name] = Texture(name)
+        return texture
+
+    @classmethod
+    def prerender(cls, weekdays, sticker):
+        """
+        1~31 일, 요일, 스티커를 미리 그려둠
+
+        Args:
+            weekdays (list): 요일 글자\n
+            sticker (str): 스티커 이름
+        """
+        for day in range(1, 31 + 1):
+            cls.get(str(day))
+        for week in weekdays:
+            cls.get(week)
+        cls.sticker(sticker)
+
+    @classmethod
+    def __render(cls, text, font) -> Texture:
+        """
+        글자를 흰색으로 그림\n
+        pythonista3 에서는 ui 로 그리고 밖에서는 headless Texture 를 씁니다
+        """
+        cls.renders += 1
+        try:
+            import ui
+        except ImportError:
+            size = (max(len(text), 1) * font[1] * 0.6, font[1])
+            return Texture(text, size)
+
+        width, height = ui.measure_string(text, font=font)
+        with ui.ImageContext(width, height) as context:
+            ui.draw_string(
+                text,
+                rect=(0, 0, width, height),
+                font=font,
+                color="white",
+                alignment=ui.ALIGN_CENTER,
+            )
+            image = context.get_image()
+        return Texture(image)
@@ -0,0 +1,103 @@
+def lastDay(year, month) -> int:
+    """
+    해당 월의 마지막날 (calendar 모듈 없이 구함)
+
+    Args:
+        year (int)\n
+        month (int)
+
+    Returns:
+        int: 28 ~ 31
+    """
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
+
+def firstWeekday(year, month) -> int:
+    """
+    해당 월 1일의 요일 (date 객체 없이 구함)
+
+    Returns:
+        int: 0 - 월요일, 6 - 일요일
+    """
+    # 3월부터 한해를 세면 윤달이 마지막에 와서 월마다 더할 값이 고정됨
+    offset = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+    if month < 3:
+        year -= 1
+    sunday = (year + year // 4 - year // 100 + year // 400 + offset[month - 1] + 1) % 7
+    return (sunday + 6) % 7
+
+
+def shiftMonth(year, month, months):
+    """
+    year 년 month 월에서 months 달 만큼 옮긴 년, 월
+
+    Args:
+        months (int): 음수라면 이전 달로
+
+    Returns:
+        int, int: 년, 월
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    return year, month + 1
+
+
+class MonthGrid:
+    """
+    한달의 달력 칸 배치
+
+    1일의 요일, 마지막날과 날짜마다 몇번째 줄 몇번째 칸인지 가지고 있습니다\n
+    (년, 월) 별로 한번만 만들고 get 으로 다시 씀
+
+    Args:
+        year (int)\n
+        month (int)
+    """
+
+    grids = {}  # {(년, 월): MonthGrid}
+
+    def __init__(self, year, month):
+        self.year = year
+        self.month = month
+        self.week = firstWeekday(year, month)
+        self.last_day = lastDay(year, month)
+        # indexes[day] = 날짜 칸 목록의 위치 (줄 * 7 + 칸), 0 일은 없음
+        self.indexes = tuple(range(self.week - 1, self.week + self.last_day))
+        self.cells = tuple(divmod(index, 7) for index in self.indexes)
+
+    @classmethod
+    def get(cls, year, month):
+        """
+        (년, 월) 의 MonthGrid 를 가져옴\n
+        없다면 새로 만들어서 기억합니다
+
+        Returns:
+            MonthGrid
+        """
+        grid = cls.grids.get((year, month))
+        if grid is None:
+            grid = cls.grids[(year, month)] = cls(year, month)
+        return grid
+
+    def day(self, index) -> int:
+        """
+        날짜 칸 목록의 위치에 있는 날짜
+
+        Args:
+            index (int): 줄 * 7 + 칸
+
+        Returns:
+            int: 이번달 칸이 아니라면 0
+        """
+        day = index - self.week + 1
+        return day if 1 <= day <= self.last_day else 0
+
+    def cell(self, day):
+        """
+        날짜의 (줄, 칸)
+
+        Returns:
+            int, int: 줄 (0 - 첫째 주), 칸 (0 - 월요일)
+        """
+        return self.cells[day]
@@ -0,0 +1,488 @@
+"""
+pythonista3 의 scene 모듈이 없을때 쓰는 대체 모듈
+
+화면에 그리지 않고 노드 생성, 속성 변경, 액션을 기록합니다\n
+액션은 시계를 직접 돌려서 (HeadlessView.advance) 진행시킵니다
+"""
+
+from collections import Counter
+
+
+DEFAULT_ORIENTATION = 0
+PORTRAIT = 1
+LANDSCAPE = 2
+
+TIMING_LINEAR = 0
+TIMING_EASE_IN = 1
+TIMING_EASE_OUT = 3
+TIMING_EASE_IN_OUT = 4
+TIMING_ELASTIC_OUT = 12
+
+
+class Stats:
+    """
+    노드와 액션 개수를 기록하는 클래스
+    """
+
+    created = Counter()  # 클래스 이름별 생성된 노드 개수
+    changes = Counter()  # 속성 이름별 변경 횟수
+    actions = 0  # run_action 호출 횟수
+    frames = 0  # 그려진 프레임 수
+
+    @classmethod
+    def reset(cls):
+        cls.created = Counter()
+        cls.changes = Counter()
+        cls.actions = 0
+        cls.frames = 0
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        return {
+            "created": dict(cls.created),
+            "changes": dict(cls.changes),
+            "actions": cls.actions,
+            "frames": cls.frames,
+        }
+
+
+class Vector2(tuple):
+    """
+    scene 의 Point, Size 를 흉내내는 클래스
+
+    숫자 또는 (숫자, 숫자) 와 곱하기, 더하기가 가능
+    """
+
+    def __new__(cls, x=0, y=0):
+        return super().__new__(cls, (x, y))
+
+    @property
+    def x(self):
+        return self[0]
+
+    @property
+    def y(self):
+        return self[1]
+
+    @property
+    def w(self):
+        return self[0]
+
+    @property
+    def h(self):
+        return self[1]
+
+    width = w
+    height = h
+
+    def __pair(self, other):
+        if isinstance(other, (int, float)):
+            return (other, other)
+        return tuple(other)
+
+    def __mul__(self, other):
+        ox, oy = self.__pair(other)
+        return type(self)(self[0] * ox, self[1] * oy)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        ox, oy = self.__pair(other)
+        return type(self)(self[0] / ox, self[1] / oy)
+
+    def __add__(self, other):
+        ox, oy = self.__pair(other)
+        return type(self)(self[0] + ox, self[1] + oy)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        ox, oy = self.__pair(other)
+        return type(self)(self[0] - ox, self[1] - oy)
+
+
+class Point(Vector2):
+    pass
+
+
+class Size(Vector2):
+    pass
+
+
+class Rect(tuple):
+    def __new__(cls, x=0, y=0, w=0, h=0):
+        return super().__new__(cls, (x, y, w, h))
+
+
+class Texture:
+    """
+    이미지 정보만 가지는 텍스쳐
+    """
+
+    def __init__(self, image, size=(32, 32)):
+        self.image = image
+        self.size = Size(*size)
+        Stats.created["Texture"] += 1
+
+
+class Touch:
+    def __init__(self, location, touch_id=0):
+        self.location = Point(*location)
+        self.prev_location = self.location
+        self.touch_id = touch_id
+
+
+class Node:
+    """
+    scene.Node 를 흉내내는 클래스
+    """
+
+    _tracked = (
+        "position",
+        "size",
+        "scale",
+        "alpha",
+        "color",
+        "text",
+        "texture",
+        "rotation",
+        "z_position",
+    )
+
+    def __init__(self, position=(0, 0), z_position=0, scale=1, alpha=1,
+                 speed=1, parent=None):
+        Stats.created[type(self).__name__] += 1
+        object.__setattr__(self, "children", [])
+        object.__setattr__(self, "parent", None)
+        object.__setattr__(self, "_actions", {})
+        object.__setattr__(self, "_next_key", 0)
+        self.position = position
+        self.z_position = z_position
+        self.scale = scale
+        self.alpha = alpha
+        self.speed = speed
+        self.paused = False
+        if parent is not None:
+            parent.add_child(self)
+
+    def __setattr__(self, name, value):
+        if name in ("position", "size"):
+            cls = Point if name == "position" else Size
+            value = cls(*value)
+        if name in self._tracked:
+            Stats.changes[name] += 1
+        object.__setattr__(self, name, value)
+
+    def add_child(self, node):
+        if node.parent is not None:
+            node.remove_from_parent()
+        self.children.append(node)
+        object.__setattr__(node, "parent", self)
+
+    def remove_from_parent(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            object.__setattr__(self, "parent", None)
+
+    def run_action(self, action, key=None):
+        Stats.actions += 1
+        if key is None:
+            key = ("_", self._next_key)
+            object.__setattr__(self, "_next_key", self._next_key + 1)
+        scene = self._scene()
+        now = scene.t if scene is not None else 0
+        events = []
+        action._events(self, 0, events)
+        events.sort(key=lambda event: event[0])
+        self._actions[key] = [now, events, action.duration]
+
+    def remove_action(self, key):
+        self._actions.pop(key, None)
+
+    def remove_all_actions(self):
+        self._actions.clear()
+
+    def _scene(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node if isinstance(node, Scene) else None
+
+    def _step(self, now):
+        """
+        now 시간까지 끝난 액션의 효과를 적용
+        """
+        for key, running in list(self._actions.items()):
+            start, events, duration = running
+            while events and start + events[0][0] <= now:
+                _, effect = events.pop(0)
+                effect()
+            if not events and start + duration <= now:
+                self._actions.pop(key, None)
+        for child in list(self.children):
+            child._step(now)
+
+    def _walk(self):
+        yield self
+        for child in self.children:
+            yield from child._walk()
+
+
+class SpriteNode(Node):
+    def __init__(self, texture=None, position=(0, 0), z_position=0, scale=1,
+                 alpha=1, speed=1, parent=None, size=None, color="white",
+                 blend_mode=0):
+        self.texture = texture
+        self.color = color
+        self.anchor_point = (0.5, 0.5)
+        if size is None:
+            size = texture.size if isinstance(texture, Texture) else (32, 32)
+        self.size = size
+        super().__init__(position, z_position, scale, alpha, speed, parent)
+
+
+class LabelNode(SpriteNode):
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("text", "font") and "font" in self.__dict__ and "text" in self.__dict__:
+            # 글자가 바뀌면 다시 그려지고 크기도 원래대로 돌아감
+            width = max(len(str(self.text)), 1) * self.font[1] * 0.6
+            super().__setattr__("size", (width, self.font[1]))
+
+    def __init__(self, text="", font=("Helvetica", 20), position=(0, 0),
+                 z_position=0, scale=1, alpha=1, speed=1, parent=None, color="white"):
+        self.font = font
+        self.text = text
+        super().__init__(None, position, z_position, scale, alpha, speed, parent,
+                         size=(max(len(str(text)), 1) * font[1] * 0.6, font[1]),
+                         color=color)
+
+
+class ShapeNode(SpriteNode):
+    def __init__(self, path=None, fill_color="white", stroke_color="clear",
+                 shadow=None, *args, **kwargs):
+        self.path = path
+        self.fill_color = fill_color
+        self.stroke_color = stroke_color
+        super().__init__(*args, **kwargs)
+
+
+class EffectNode(Node):
+    pass
+
+
+class Action:
+    """
+    scene.Action 을 흉내내는 클래스
+
+    실제 보간은 하지 않고 각 액션이 끝나는 시점에 최종값을 적용합니다
+    """
+
+    def __init__(self, duration=0, effect=None, children=(), is_group=False):
+        self.duration = duration
+        self.effect = effect
+        self.children = children
+        self.is_group = is_group
+
+    def _events(self, node, offset, events):
+        if self.children:
+            t = offset
+            for child in self.children:
+                child._events(node, offset if self.is_group else t, events)
+                t += child.duration
+        elif self.effect is not None:
+            effect = self.effect
+            events.append((offset + self.duration, lambda: effect(node)))
+
+    @staticmethod
+    def __set(name, value):
+        return lambda node: setattr(node, name, value)
+
+    @classmethod
+    def sequence(cls, *actions):
+        if len(actions) == 1 and isinstance(actions[0], (list, tuple)):
+            actions = actions[0]
+        actions = tuple(a for a in actions if isinstance(a, Action))
+        return cls(sum(a.duration for a in actions), children=actions)
+
+    @classmethod
+    def group(cls, *actions):
+        if len(actions) == 1 and isinstance(actions[0], (list, tuple)):
+            actions = actions[0]
+        actions = tuple(a for a in actions if isinstance(a, Action))
+        duration = max((a.duration for a in actions), default=0)
+        return cls(duration, children=actions, is_group=True)
+
+    @classmethod
+    def repeat(cls, action, count):
+        return cls.sequence(*([action] * count))
+
+    @classmethod
+    def move_to(cls, x, y, duration=0.5, timing_mode=TIMING_LINEAR):
+        return cls(duration, cls.__set("position", (x, y)))
+
+    @classmethod
+    def move_by(cls, dx, dy, duration=0.5, timing_mode=TIMING_LINEAR):
+        def effect(node):
+            x, y = node.position
+            node.position = (x + dx, y + dy)
+
+        return cls(duration, effect)
+
+    @classmethod
+    def scale_to(cls, scale, duration=0.5, timing_mode=TIMING_LINEAR):
+        return cls(duration, cls.__set("scale", scale))
+
+    @classmethod
+    def fade_to(cls, alpha, duration=0.5, timing_mode=TIMING_LINEAR):
+        return cls(duration, cls.__set("alpha", alpha))
+
+    @classmethod
+    def rotate_to(cls, radians, duration=0.5, timing_mode=TIMING_LINEAR):
+        return cls(duration, cls.__set("rotation", radians))
+
+    @classmethod
+    def wait(cls, duration):
+        return cls(duration)
+
+    @classmethod
+    def call(cls, func, duration=0):
+        return cls(duration, lambda node: func())
+
+    @classmethod
+    def remove(cls):
+        return cls(0, lambda node: node.remove_from_parent())
+
+
+class Scene(Node):
+    """
+    scene.Scene 을 흉내내는 클래스
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.size = (0, 0)
+        self.bounds = Rect()
+        self.t = 0.0
+        self.dt = 0.0
+        self.view = None
+        self.background_color = "black"
+
+    def setup(self):
+        pass
+
+    def update(self):
+        pass
+
+    def did_evaluate_actions(self):
+        pass
+
+    def did_change_size(self):
+        pass
+
+    def touch_began(self, touch):
+        pass
+
+    def touch_moved(self, touch):
+        pass
+
+    def touch_ended(self, touch):
+        pass
+
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class HeadlessView:
+    """
+    Scene 을 화면 없이 실행시키는 클래스
+
+    Args:
+        scene (Scene)\n
+        size (숫자, 숫자): 화면 크기\n
+        fps (int): advance 할때 쓰는 초당 프레임 수
+    """
+
+    def __init__(self, scene, size=(375, 667), fps=60):
+        self.scene = scene
+        self.fps = fps
+        self.touch_id = 0
+        scene.view = self
+        object.__setattr__(scene, "size", Size(*size))
+        scene.bounds = Rect(0, 0, *size)
+        scene.setup()
+
+    def advance(self, seconds):
+        """
+        seconds 만큼 시계를 진행시킴\n
+        scene.paused 면 프레임을 그리지 않습니다
+        """
+        scene = self.scene
+        frames = max(int(round(seconds * self.fps)), 1)
+        dt = 1 / self.fps
+        for _ in range(frames):
+            if scene.paused:
+                continue
+            scene.dt = dt
+            scene.t += dt
+            scene.update()
+            scene._step(scene.t)
+            scene.did_evaluate_actions()
+            Stats.frames += 1
+
+    def touch(self, location):
+        """
+        location 위치를 터치함
+        """
+        self.touch_id += 1
+        touch = Touch(location, self.touch_id)
+        self.scene.touch_began(touch)
+        self.scene.touch_ended(touch)
+
+    def resize(self, size):
+        """
+        화면 크기를 바꿈 (폰 방향 전환)
+        """
+        object.__setattr__(self.scene, "size", Size(*size))
+        self.scene.bounds = Rect(0, 0, *size)
+        self.scene.did_change_size()
+
+    def stop(self):
+        self.scene.stop()
+
+    def nodes(self) -> int:
+        """
+        scene 에 붙어있는 노드 개수
+        """
+        return sum(1 for _ in self.scene._walk()) - 1
+
+    def running(self) -> int:
+        """
+        실행중인 액션 개수
+        """
+        return sum(len(node._actions) for node in self.scene._walk())
+
+
+def run(scene, orientation=DEFAULT_ORIENTATION, frame_interval=1,
+        anti_alias=False, show_fps=False, multi_touch=True, size=None):
+    """
+    scene.run 을 흉내냄\n
+    화면이 없으므로 HeadlessView 를 리턴
+    """
+    if size is None:
+        size = (667, 375) if orientation == LANDSCAPE else (375, 667)
+    return HeadlessView(scene, size, fps=60 // frame_interval)
+
+
+def get_screen_size():
+    return Size(375, 667)
+
+
+def get_screen_scale():
+    return 2.0
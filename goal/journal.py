@@ -0,0 +1,195 @@
+import os, json, threading
+
+from .bitmap import fold
+
+
+class Journal:
+    """
+    체크 기록을 한 줄씩 덧붙여 저장하는 클래스
+
+    클릭 한번에 한 줄만 덧붙이므로 기록이 많아도 저장 비용이 일정합니다\n
+    쌓인 기록은 백그라운드에서 {year}.json 스냅샷으로 합쳐집니다 (compaction)
+
+    Args:
+        file (File): 스냅샷을 읽고 쓸 File 클래스
+        limit (int): 이 개수 이상 기록이 쌓이면 compaction 실행
+    """
+
+    name = "journal.log"
+    old_name = "journal.old"
+
+    def __init__(self, file, limit=256):
+        self.file = file
+        self.path = os.path.join(file.path, self.name)
+        self.old_path = os.path.join(file.path, self.old_name)
+        self.limit = limit
+
+        self.count = 0
+        self.pending = {}  # 아직 스냅샷에 들어가지 않은 기록 {(년, 월): {일: bool}}
+        self.compacting = {}  # compaction 중인 기록
+        self.lock = threading.Lock()
+        self.thread = None
+
+        self.__recover()
+
+    def append(self, year, month, day, is_bool):
+        """
+        기록 한 줄을 덧붙임
+
+        Args:
+            year (int)\n
+            month (int)\n
+            day (int)\n
+            is_bool (bool): true - 체크, false - 체크 해제
+        """
+        self.extend([(year, month, day, is_bool)])
+
+    def extend(self, records):
+        """
+        여러 기록을 한번에 덧붙임
+
+        Args:
+            records (list): (년, 월, 일, bool) 의 리스트
+        """
+        if not records:
+            return
+
+        lines = "".join(
+            json.dumps([year, month, day, int(is_bool)]) + "\n"
+            for year, month, day, is_bool in records
+        )
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            for year, month, day, is_bool in records:
+                self.__record(self.pending, year, month, day, is_bool)
+            self.count += len(records)
+            count = self.count
+
+        if self.limit <= count:
+            self.compactLater()
+
+    def changes(self, year) -> list:
+        """
+        스냅샷에 아직 합쳐지지 않은 year 년 기록을 복사해서 가져옴
+
+        Returns:
+            list: [(월, {일: bool}), ...] 오래된 기록부터
+        """
+        with self.lock:
+            return [
+                (month, dict(days))
+                for layer in (self.compacting, self.pending)
+                for (y, month), days in layer.items()
+                if y == year
+            ]
+
+    def apply(self, year, data, changes=None) -> dict:
+        """
+        스냅샷 데이터에 아직 합쳐지지 않은 기록을 덮어씀
+
+        Args:
+            year (int)\n
+            data (dict): File.readBits 로 읽어온 {"월": MonthBits}\n
+            changes (list): 스냅샷을 읽기 전에 changes 로 가져온 기록, 없다면 지금 기록
+
+        Returns:
+            dict: 기록이 반영된 데이터
+        """
+        if changes is None:
+            changes = self.changes(year)
+        return fold(data, changes)
+
+    def compactLater(self):
+        """
+        백그라운드 쓰레드로 compaction 실행\n
+        이미 실행중이라면 실행되지 않습니다
+        """
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.compact, daemon=True)
+            self.thread.start()
+
+    def compact(self):
+        """
+        쌓인 기록을 {year}.json 스냅샷으로 합침
+
+        journal.log 를 journal.old 로 바꾼 뒤 합치므로
+        도중에 앱이 꺼져도 다음 실행시 이어서 합칩니다
+        """
+        with self.lock:
+            if not os.path.isfile(self.old_path):
+                if self.count == 0:
+                    return
+                os.replace(self.path, self.old_path)
+                for key, days in self.pending.items():
+                    self.compacting.setdefault(key, {}).update(days)
+                self.pending = {}
+                self.count = 0
+            compacting = self.compacting
+
+        years = {}
+        for (year, month), days in compacting.items():
+            years.setdefault(year, []).append((month, days))
+
+        # 스냅샷을 쓰고 compacting 을 비우는 동안 File.readYear 가 읽지 않도록
+        # file.lock 을 잡은 채로 비움
+        with self.file.lock:
+            for year, changes in years.items():
+                self.file.writeBits(year, fold(self.file.readBits(year), changes))
+
+            with self.lock:
+                os.remove(self.old_path)
+                self.compacting = {}
+
+    def close(self):
+        """
+        실행중인 compaction 이 끝날때까지 기다림
+        """
+        thread = self.thread
+        if thread is not None:
+            thread.join()
+
+    def __recover(self):
+        """
+        남아있는 기록을 읽어옴\n
+        중간에 끊긴 마지막 줄은 버립니다
+        """
+        if os.path.isfile(self.old_path):
+            self.__replay(self.old_path, self.compacting)
+        if os.path.isfile(self.path):
+            self.count = self.__replay(self.path, self.pending)
+        if os.path.isfile(self.old_path) or self.count:
+            self.compactLater()
+
+    def __replay(self, path, layer) -> int:
+        """
+        파일의 기록을 layer 에 다시 적용
+
+        Returns:
+            int: 읽은 기록 개수
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        end = raw.rfind(b"\n") + 1
+        if end != len(raw):
+            with open(path, "r+b") as f:
+                f.truncate(end)
+
+        count = 0
+        for line in raw[:end].splitlines():
+            try:
+                year, month, day, is_bool = json.loads(line)
+            except ValueError:
+                continue
+            self.__record(layer, year, month, day, bool(is_bool))
+            count += 1
+        return count
+
+    @staticmethod
+    def __record(layer, year, month, day, is_bool):
+        layer.setdefault((year, month), {})[day] = is_bool
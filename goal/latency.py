@@ -0,0 +1,144 @@
+import threading
+from time import perf_counter
+from collections import deque
+
+
+class Histogram:
+    """
+    최근 size 개의 시간만 기억하는 히스토그램
+
+    Args:
+        size (int): 기억할 개수
+    """
+
+    bounds = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+    def __init__(self, size=1000):
+        self.values = deque(maxlen=size)
+        self.count = 0  # 지금까지 들어온 전체 개수
+
+    def add(self, seconds):
+        self.values.append(seconds)
+        self.count += 1
+
+    def summary(self) -> dict:
+        """
+        최근 값들의 통계
+
+        Returns:
+            dict: count, mean, p50, p90, p99, max (초) 와 buckets
+        """
+        values = sorted(self.values)
+        if not values:
+            return {"count": self.count}
+
+        def percent(p):
+            return values[min(int(len(values) * p), len(values) - 1)]
+
+        buckets = [0] * (len(self.bounds) + 1)
+        index = 0
+        for value in values:
+            while index < len(self.bounds) and self.bounds[index] <= value:
+                index += 1
+            buckets[index] += 1
+
+        return {
+            "count": self.count,
+            "mean": sum(values) / len(values),
+            "p50": percent(0.5),
+            "p90": percent(0.9),
+            "p99": percent(0.99),
+            "max": values[-1],
+            "buckets": dict(zip([f"<{b * 1000:g}ms" for b in self.bounds] + ["more"], buckets)),
+        }
+
+
+class Latency:
+    """
+    터치부터 저장까지 단계별 시간을 기록하는 클래스
+
+    단계: hit (칸 찾기), swap (노드 바꾸기), commit (저장소에 넘기기),
+    text (글자 바꾸기), total (터치 전체), persist (터치부터 저장 완료까지)
+
+    Args:
+        callback (function): 요약을 받을 함수, 없다면 print\n
+        size (int): 단계별로 기억할 개수
+
+    persist 는 SaveQueue 쓰레드에서 기록되므로 add 와 summary 는 lock 을 잡습니다
+    """
+
+    def __init__(self, callback=None, size=1000):
+        self.callback = callback
+        self.size = size
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def time(self) -> float:
+        return perf_counter()
+
+    def record(self, name, start):
+        """
+        start 부터 지금까지 걸린 시간을 기록
+
+        Args:
+            name (str): 단계 이름\n
+            start (float): time() 으로 받은 시작 시간
+        """
+        self.add(name, perf_counter() - start)
+
+    def add(self, name, seconds):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.size)
+            histogram.add(seconds)
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: {단계: Histogram.summary}
+        """
+        with self.lock:
+            return {name: h.summary() for name, h in self.histograms.items()}
+
+    def report(self) -> str:
+        """
+        요약을 표로 만듦
+        """
+        lines = [f"{'':8} {'count':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} (ms)"]
+        for name, s in self.summary().items():
+            if "mean" not in s:
+                continue
+            lines.append(
+                f"{name:8} {s['count']:6d}"
+                + "".join(f" {s[key] * 1000:9.3f}" for key in ("p50", "p90", "p99", "max"))
+            )
+        return "\n".join(lines)
+
+    def dump(self):
+        """
+        요약을 callback 으로 넘기거나 print 함
+        """
+        if self.callback is not None:
+            self.callback(self.summary())
+        else:
+            print(self.report())
+
+
+class NoLatency(Latency):
+    """
+    측정을 끈 상태\n
+    아무것도 기록하지 않습니다
+    """
+
+    def time(self) -> float:
+        return 0
+
+    def record(self, name, start):
+        pass
+
+    def add(self, name, seconds):
+        pass
+
+    def dump(self):
+        pass
@@ -1,8 +1,12 @@
-from scene import DEFAULT_ORIENTATION, PORTRAIT, LANDSCAPE
-
 from .check import *
 
 
+# scene 모듈의 폰방향 값과 같음 (option 은 scene 없이 불러올 수 있도록)
+DEFAULT_ORIENTATION = 0
+PORTRAIT = 1
+LANDSCAPE = 2
+
+
 class Option:
     class __Help:
         @property
@@ -22,6 +26,45 @@ class Option:
         def 가로(self):
             Setting.orientation = LANDSCAPE
             return LANDSCAPE
+    class __Storage:
+        @property
+        def 기본(self):
+            Setting.storage = "json"
+            return "json"
+        @property
+        def 비트맵(self):
+            Setting.storage = "bitmap"
+            return "bitmap"
+        @property
+        def 데이터베이스(self):
+            Setting.storage = "sqlite"
+            return "sqlite"
+    class __Latency:
+        @property
+        def 켬(self):
+            Setting.latency = True
+            return True
+        @property
+        def 끔(self):
+            Setting.latency = False
+            return False
+        @property
+        def 콜백(self):
+            return Setting.latency_callback
+        @콜백.setter
+        def 콜백(self, callback):
+            if not callable(callback):
+                raise ValueError("함수를 넣어야 함")
+            Setting.latency_callback = callback
+    class __Idle:
+        @property
+        def 켬(self):
+            Setting.idle = True
+            return True
+        @property
+        def 끔(self):
+            Setting.idle = False
+            return False
     class __Calender:
         @property
         def 스티커(self):
@@ -130,6 +173,9 @@ class Option:
     
     도움말 = __Help()
     폰방향 = __Orientation()
+    저장소 = __Storage()
+    측정 = __Latency()
+    절전 = __Idle()
     달력 = __Calender()
     타이틀 = __Title()
     버튼 = __Button()
@@ -147,6 +193,10 @@ class _Sunday:
 
 class Setting:
     orientation = DEFAULT_ORIENTATION
+    storage = "json"
+    latency = False
+    latency_callback = None
+    idle = True
     complete = "typw:Check"
     help = True
     title = _Object()
@@ -0,0 +1,78 @@
+import threading
+
+
+class Prefetcher:
+    """
+    다음에 볼 것 같은 달을 백그라운드 쓰레드에서 미리 준비하는 클래스
+
+    request 를 부를때마다 이전 요청은 취소되고 새 요청만 남습니다\n
+    이미 준비중인 달은 끝까지 준비하고 남은 요청만 버립니다
+
+    Args:
+        load (function): (년, 월) 을 받아 미리 준비하는 함수
+    """
+
+    def __init__(self, load):
+        self.load = load
+
+        self.queue = []  # 준비할 (년, 월)
+        self.loading = None  # 준비중인 (년, 월)
+        self.closed = False
+        self.error = None  # 마지막으로 실패한 이유, 미리 준비는 실패해도 됨
+        self.condition = threading.Condition()
+
+        self.thread = threading.Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+    def request(self, months):
+        """
+        준비할 달을 바꿈
+
+        Args:
+            months (list): [(년, 월), ...] 앞에 있는 것부터 준비
+        """
+        with self.condition:
+            self.queue = list(months)
+            self.condition.notify_all()
+
+    def cancel(self):
+        """
+        아직 시작하지 않은 요청을 모두 버림
+        """
+        self.request([])
+
+    def wait(self):
+        """
+        요청한 달이 모두 준비될때까지 기다림
+        """
+        with self.condition:
+            while self.queue or self.loading is not None:
+                self.condition.wait()
+
+    def close(self):
+        """
+        남은 요청을 버리고 쓰레드를 멈춤
+        """
+        with self.condition:
+            self.queue = []
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    def __run(self):
+        while True:
+            with self.condition:
+                while not self.queue and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                self.loading = self.queue.pop(0)
+
+            try:
+                self.load(*self.loading)
+            except Exception as e:
+                self.error = e
+            finally:
+                with self.condition:
+                    self.loading = None
+                    self.condition.notify_all()
@@ -0,0 +1,249 @@
+from datetime import date, timedelta
+
+from .option import Setting
+from .storage import openStorage
+from .grid import lastDay
+
+
+class Statistics:
+    """
+    체크 기록의 통계 (연속 기록, 달성률) 를 가지는 클래스
+
+    처음 쓸때 저장소의 기록을 한번 읽고 그 뒤로는 update 로 바뀐 날짜만 반영합니다\n
+    년도별 누적 개수를 가지고 있어서 기간 개수는 O(1) 입니다
+
+    Args:
+        storage (Storage): 기록을 읽어올 저장소
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.loaded = False
+        self.first = None  # 첫 년도
+        self.last = None  # 마지막 년도
+        self.origin = 0  # first 년 1월 1일의 ordinal
+        self.bits = 0  # origin 부터 하루에 1비트
+        self.prefix = {}  # {년: [1월 1일 전까지 개수, 1일까지, 2일까지, ...]}
+        self.before = {}  # {년: 그 해 전까지의 개수}
+        self.longest = 0  # 가장 긴 연속 기록
+
+    @classmethod
+    def open(cls, script, kind=None):
+        """
+        DataController 와 같은 위치의 저장소를 열어서 통계를 만듦
+
+        Args:
+            script (str): goal 을 실행하는 파일 위치\n
+            kind (str): 저장소 종류, 없다면 option 에서 고른 저장소
+
+        Returns:
+            Statistics: 다 쓴 뒤에 close 로 저장소를 닫아야 함
+        """
+        return cls(openStorage(script, kind or Setting.storage))
+
+    def load(self):
+        """
+        저장소의 기록을 모두 읽어옴\n
+        이미 읽었다면 실행되지 않습니다
+        """
+        if self.loaded:
+            return
+
+        years = self.storage.years() or [date.today().year]
+        self.first = self.last = years[0]
+        self.origin = date(self.first, 1, 1).toordinal()
+        self.__extend(years[-1])
+        for year in range(self.first, self.last + 1):
+            data = self.storage.readYear(year)
+            for month in range(1, 12 + 1):
+                self.bits |= data[str(month)].bits << self.__index(date(year, month, 1))
+            self.__buildPrefix(year)
+        self.__buildBefore()
+        self.longest = self.__longest()
+        self.loaded = True
+
+    def update(self, year, month, day, is_bool):
+        """
+        체크 또는 체크 해제된 날짜를 반영\n
+        DataController.commit 에서 부릅니다
+
+        Args:
+            year (int)\n
+            month (int)\n
+            day (int)\n
+            is_bool (bool): true - 체크, false - 체크 해제
+        """
+        if not self.loaded:
+            return  # 처음 읽을때 저장소에서 같이 읽어옴
+
+        self.__extend(year)
+        d = date(year, month, day)
+        index = self.__index(d)
+        if bool(self.bits >> index & 1) == is_bool:
+            return
+
+        run = 0 if is_bool else self.__run(index)
+        self.bits ^= 1 << index
+
+        step = 1 if is_bool else -1
+        prefix = self.prefix[year]
+        for i in range(d.timetuple().tm_yday, len(prefix)):
+            prefix[i] += step
+        for y in range(year + 1, self.last + 1):
+            self.before[y] += step
+
+        if is_bool:
+            self.longest = max(self.longest, self.__run(index))
+        elif run == self.longest:
+            self.longest = self.__longest()
+
+    def count(self, start, end) -> int:
+        """
+        start 부터 end 까지 체크된 날짜 개수
+
+        Args:
+            start (date)\n
+            end (date): 포함
+        """
+        self.load()
+        return self.__prefixCount(end) - self.__prefixCount(start - timedelta(days=1))
+
+    def monthRate(self, year, month) -> float:
+        """
+        한달 달성률 (0~1)
+        """
+        last = lastDay(year, month)
+        return self.count(date(year, month, 1), date(year, month, last)) / last
+
+    def yearRate(self, year, today=None) -> float:
+        """
+        일년 달성률 (0~1)\n
+        올해라면 today 까지의 날짜로 나눕니다
+        """
+        today = today or date.today()
+        start = date(year, 1, 1)
+        end = min(date(year, 12, 31), today) if year == today.year else date(year, 12, 31)
+        if end < start:
+            return 0.0
+        return self.count(start, end) / ((end - start).days + 1)
+
+    def rolling(self, days, today=None) -> float:
+        """
+        today 까지 최근 days 일의 달성률 (0~1)
+        """
+        today = today or date.today()
+        return self.count(today - timedelta(days=days - 1), today) / days
+
+    def streak(self, today=None) -> int:
+        """
+        지금 이어지고 있는 연속 기록\n
+        오늘 아직 체크하지 않았다면 어제까지의 연속 기록
+
+        Returns:
+            int: 일
+        """
+        self.load()
+        index = self.__index(today or date.today())
+        if index < 0:
+            return 0  # 기록이 시작되기 전
+        if not self.bits >> index & 1:
+            index -= 1
+        if index < 0 or not self.bits >> index & 1:
+            return 0
+        mask = (1 << (index + 1)) - 1
+        zeros = ~self.bits & mask
+        return index + 1 - zeros.bit_length()
+
+    def summary(self, today=None) -> dict:
+        """
+        화면이나 다른 곳에서 쓸 통계 모음
+
+        Returns:
+            dict: streak, longest, month, year, week (7일), days30 (30일)
+        """
+        self.load()
+        today = today or date.today()
+        return {
+            "streak": self.streak(today),
+            "longest": self.longest,
+            "month": self.monthRate(today.year, today.month),
+            "year": self.yearRate(today.year, today),
+            "week": self.rolling(7, today),
+            "days30": self.rolling(30, today),
+        }
+
+    def close(self):
+        """
+        open 으로 만든 저장소를 닫음
+        """
+        self.storage.close()
+
+    def __index(self, d) -> int:
+        return d.toordinal() - self.origin
+
+    def __prefixCount(self, d) -> int:
+        """
+        처음부터 d 까지 체크된 날짜 개수
+        """
+        if d.year < self.first:
+            return 0
+        if self.last < d.year:
+            return self.before[self.last] + self.prefix[self.last][-1]
+        return self.before[d.year] + self.prefix[d.year][d.timetuple().tm_yday]
+
+    def __extend(self, year):
+        """
+        year 가 들어가도록 년도 범위를 넓힘
+        """
+        if year < self.first:
+            origin = date(year, 1, 1).toordinal()
+            self.bits <<= self.origin - origin
+            self.origin = origin
+            for y in range(year, self.first):
+                self.prefix[y] = [0] * (self.__length(y) + 1)
+            self.first = year
+            self.__buildBefore()
+        elif self.last < year or year not in self.prefix:
+            for y in range(self.last, year + 1):
+                if y not in self.prefix:
+                    self.prefix[y] = [0] * (self.__length(y) + 1)
+            self.last = max(self.last, year)
+            self.__buildBefore()
+
+    def __length(self, year) -> int:
+        return date(year, 12, 31).timetuple().tm_yday
+
+    def __buildPrefix(self, year):
+        bits = self.bits >> self.__index(date(year, 1, 1))
+        prefix = self.prefix[year]
+        for day in range(1, len(prefix)):
+            prefix[day] = prefix[day - 1] + (bits & 1)
+            bits >>= 1
+
+    def __buildBefore(self):
+        total = 0
+        for year in range(self.first, self.last + 1):
+            self.before[year] = total
+            total += self.prefix[year][-1]
+
+    def __run(self, index) -> int:
+        """
+        index 를 포함한 연속 기록의 길이
+        """
+        if not self.bits >> index & 1:
+            return 0
+        mask = (1 << (index + 1)) - 1
+        start = (~self.bits & mask).bit_length()
+        upper = self.bits >> index
+        end = (upper ^ (upper + 1)).bit_length() - 1
+        return index - start + end
+
+    def __longest(self) -> int:
+        """
+        가장 긴 연속 기록을 처음부터 다시 구함
+        """
+        bits, length = self.bits, 0
+        while bits:
+            bits &= bits >> 1
+            length += 1
+        return length
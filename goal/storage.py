@@ -0,0 +1,660 @@
+import os, json, mmap, struct, threading
+from datetime import date
+
+from .bitmap import MonthBits, emptyYear
+from .grid import lastDay
+from .journal import Journal
+from .writer import SaveQueue
+
+
+class Storage:
+    """
+    체크 기록을 저장하는 저장소 클래스
+
+    상속용\n
+    readYear, commit, years 는 반드시 만들어야 합니다
+    """
+
+    def readYear(self, year) -> dict:
+        """
+        일년치 데이터를 가져옴
+
+        Args:
+            year (int)
+
+        Returns:
+            dict: {"월": MonthBits}
+        """
+        raise NotImplementedError
+
+    def commit(self, year, month, day, is_bool):
+        """
+        해당 날짜를 체크 또는 체크 해제
+
+        Args:
+            year (int)\n
+            month (int)\n
+            day (int)\n
+            is_bool (bool): true - 체크, false - 체크 해제
+        """
+        raise NotImplementedError
+
+    def years(self) -> list:
+        """
+        기록이 있을 수 있는 년도들
+
+        Returns:
+            list: [년, ...] 작은 순서
+        """
+        raise NotImplementedError
+
+    def save(self, year, month):
+        """
+        달이 바뀔때 실행\n
+        모아둔 기록을 정리할 저장소만 만들면 됩니다
+        """
+        pass
+
+    def days(self, start, end) -> list:
+        """
+        start 부터 end 까지 체크된 날짜들
+
+        Args:
+            start (date)\n
+            end (date): 포함
+
+        Returns:
+            list: [date, ...]
+        """
+        result = []
+        for year in range(start.year, end.year + 1):
+            data = self.readYear(year)
+            for month in range(1, 12 + 1):
+                for day in data[str(month)]:
+                    d = date(year, month, day)
+                    if start <= d <= end:
+                        result.append(d)
+        return result
+
+    def count(self, start, end) -> int:
+        """
+        start 부터 end 까지 체크된 날짜 개수
+
+        Args:
+            start (date)\n
+            end (date): 포함
+        """
+        return len(self.days(start, end))
+
+    def flush(self):
+        """
+        모아둔 기록이 저장될때까지 기다림
+        """
+        pass
+
+    def close(self):
+        """
+        저장소를 닫음
+        """
+        pass
+
+
+class File(Storage):
+    """
+    파일 쓰기, 읽기 기능이 있는 클래스
+
+    년도별 json 파일에 저장하는 기본 저장소 입니다\n
+    체크 기록은 SaveQueue 를 거쳐 Journal 에 쌓인 뒤 json 파일로 합쳐집니다
+
+    Args:
+        path (str): 읽고 쓸 위치
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        self.journal = Journal(self)
+        self.queue = SaveQueue(self.journal)
+
+    def read(self, year) -> dict:
+        """
+        json 데이터를 읽어서 dict 형식으로 변환
+
+        Args:
+            year (int): 파일의 이름 2023.json
+
+        Returns:
+            dict: 읽어온 파일의 정보를 리턴
+        """
+        name = os.path.join(self.path, f"{year}.json")
+        with open(name, "r", encoding="utf-8") as f:
+            data = f.read()
+        return json.loads(data)
+
+    def write(self, year, data):
+        """
+        파일을 읽고 json 형식으로 저장\n
+        임시 파일에 쓴 뒤 바꿔치기 하므로 쓰는 도중 꺼져도 기존 파일이 남습니다
+
+        Args:
+            year (int): 파일의 이름 2023.json
+            data (int): 파일에 저장할 데이터 정보
+
+        Returns:
+            dict: 읽어온 파일의 정보를 리턴
+        """
+        if isinstance(data, dict):
+            data = json.dumps(data)
+
+        name = os.path.join(self.path, f"{year}.json")
+        temp = name + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, name)
+
+    def isfile(self, year) -> bool:
+        """
+        파일이 존재하는지 확인
+
+        Args:
+            year (int): 파일의 이름 2023.json
+
+        Returns:
+            bool: 파일의 존재여부
+        """
+        return os.path.isfile(os.path.join(self.path, f"{year}.json"))
+
+    def readBits(self, year) -> dict:
+        """
+        json 파일을 MonthBits 로 읽어옴\n
+        파일이 없다면 빈 데이터
+
+        Returns:
+            dict: {"월": MonthBits}
+        """
+        data = emptyYear()
+        if self.isfile(year):
+            for month, days in self.read(year).items():
+                data[month] = MonthBits(days)
+        return data
+
+    def writeBits(self, year, data):
+        """
+        {"월": MonthBits} 를 json 파일로 저장
+        """
+        self.write(year, {month: list(days) for month, days in data.items()})
+
+    def readYear(self, year) -> dict:
+        """
+        파일에서 데이터를 읽어오고 저장되지 않은 기록을 덮어씁니다\n
+        파일이 없다면 빈 데이터에 덮어쓰고 파일은 만들지 않습니다 (compaction 때 만들어짐)
+
+        Args:
+            year (int): 파일의 이름 2023.json
+
+        Returns:
+            dict: {"월": MonthBits}
+        """
+        # 기록은 대기열 -> 저널 -> 스냅샷 순서로 옮겨지므로 새 층부터 복사해야
+        # 읽는 도중 옮겨진 기록을 놓치지 않음
+        queued = self.queue.changes(year)
+        # compaction 이 스냅샷을 바꾸는 도중에 읽지 않도록 lock 을 잡음
+        with self.lock:
+            journaled = self.journal.changes(year)
+            data = self.readBits(year)
+        data = self.journal.apply(year, data, journaled)
+        return self.queue.apply(year, data, queued)
+
+    def commit(self, year, month, day, is_bool):
+        """
+        기록을 저장 대기열에 넣습니다\n
+        실제 저널 기록은 SaveQueue 쓰레드가 합니다
+        """
+        self.queue.put(year, month, day, is_bool)
+
+    def years(self) -> list:
+        """
+        {year}.json 파일이 있거나 저널에 기록이 남은 년도들
+        """
+        self.queue.flush()
+        years = set()
+        # compaction 이 저널의 년도를 새 파일로 옮기는 도중에 보지 않도록 lock 을 잡음
+        with self.lock:
+            for name in os.listdir(self.path):
+                year, ext = os.path.splitext(name)
+                if ext == ".json" and year.isdigit():
+                    years.add(int(year))
+            with self.journal.lock:
+                for layer in (self.journal.compacting, self.journal.pending):
+                    years.update(year for year, month in layer)
+        return sorted(years)
+
+    def save(self, year, month):
+        """
+        저널에 쌓인 기록을 백그라운드에서 json 파일로 합칩니다
+        """
+        self.journal.compactLater()
+
+    def flush(self):
+        self.queue.flush()
+
+    def close(self):
+        try:
+            self.queue.close()
+        finally:
+            self.journal.close()
+
+
+class BitmapFile(Storage):
+    """
+    epoch 부터 하루에 1비트씩 한 파일에 저장하는 클래스
+
+    파일은 mmap 으로 열어서 읽고 쓰므로
+    하루, 한달, 일년 단위로 파싱 없이 바로 읽을 수 있습니다\n
+    파일 앞 16 바이트는 헤더 (magic, 버전, epoch) 이고 비트는 그 뒤부터 입니다
+
+    Args:
+        path (str): 파일을 저장할 위치
+    """
+
+    name = "goal.bits"
+    epoch = date(1970, 1, 1)  # 새 파일의 epoch, 열린 파일은 헤더의 값을 씀
+    magic = b"GOALBITS"
+    version = 1
+    header = struct.Struct("<8sHHi")  # magic, 버전, 예약, epoch 의 ordinal
+
+    def __init__(self, path):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        self.path = os.path.join(path, self.name)
+        if not os.path.isfile(self.path):
+            with open(self.path, "wb") as f:
+                f.write(self.header.pack(self.magic, self.version, 0, self.epoch.toordinal()))
+                f.write(b"\0" * 8)
+
+        self.file = open(self.path, "r+b")
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.lock = threading.RLock()  # 파일이 커지면서 mmap 을 다시 열때 읽지 않도록
+        try:
+            self.epoch = self.__readHeader()
+        except ValueError:
+            self.map.close()
+            self.file.close()
+            raise
+
+    def index(self, year, month, day) -> int:
+        """
+        epoch 부터 몇번째 날인지 구함
+
+        Returns:
+            int: 비트 번호
+        """
+        index = date(year, month, day).toordinal() - self.epoch.toordinal()
+        if index < 0:
+            raise ValueError(f"{self.epoch} 이전 날짜는 저장할 수 없음")
+        return index
+
+    def get(self, year, month, day) -> bool:
+        """
+        해당 날짜가 체크되었는지 확인\n
+        epoch 이전 날짜는 체크되지 않은 날짜 입니다
+        """
+        if date(year, month, day) < self.epoch:
+            return False
+        index = self.index(year, month, day)
+        with self.lock:
+            if len(self.map) <= self.header.size + (index >> 3):
+                return False
+            return bool(self.map[self.header.size + (index >> 3)] >> (index & 7) & 1)
+
+    def set(self, year, month, day, is_bool):
+        """
+        해당 날짜를 체크 또는 체크 해제
+
+        Args:
+            is_bool (bool): true - 체크, false - 체크 해제
+        """
+        index = self.index(year, month, day)
+        position = self.header.size + (index >> 3)
+        with self.lock:
+            self.__grow(index)
+            if is_bool:
+                self.map[position] |= 1 << (index & 7)
+            else:
+                self.map[position] &= ~(1 << (index & 7)) & 0xFF
+
+    def view(self, start, end) -> memoryview:
+        """
+        start 날짜부터 end 날짜까지 들어있는 바이트를 복사없이 가져옴
+
+        Args:
+            start (date)\n
+            end (date): 포함
+
+        Returns:
+            memoryview: 첫 바이트의 (start 비트 번호 & 7) 번 비트부터 시작
+        """
+        first = max(start.toordinal() - self.epoch.toordinal(), 0)
+        last = end.toordinal() - self.epoch.toordinal()
+        size = self.header.size
+        return memoryview(self.map)[size + (first >> 3) : size + (last >> 3) + 1]
+
+    def month(self, year, month) -> MonthBits:
+        """
+        한달치 데이터를 MonthBits 로 가져옴
+        """
+        start = date(year, month, 1)
+        end = date(year, month, lastDay(year, month))
+        bits = MonthBits()
+        bits.bits = self.__bits(start, end)
+        return bits
+
+    def year(self, year) -> dict:
+        """
+        일년치 데이터를 가져옴
+
+        Returns:
+            dict: {"월": MonthBits}
+        """
+        return {str(month): self.month(year, month) for month in range(1, 12 + 1)}
+
+    def readYear(self, year) -> dict:
+        return self.year(year)
+
+    def commit(self, year, month, day, is_bool):
+        """
+        epoch 이전 날짜는 저장할 수 없으므로 무시합니다
+        """
+        if date(year, month, day) < self.epoch:
+            return
+        self.set(year, month, day, is_bool)
+
+    def years(self) -> list:
+        """
+        처음 켜진 비트부터 마지막 켜진 비트까지의 년도들
+        """
+        with self.lock:
+            data = self.map[self.header.size :]
+        first = len(data) - len(data.lstrip(b"\0"))
+        last = len(data.rstrip(b"\0")) - 1
+        if last < first:
+            return []
+        # 바이트 안에서 가장 낮은, 가장 높은 켜진 비트까지 찾아야 옆 년도가 끼지 않음
+        low, high = data[first], data[last]
+        first = first * 8 + (low & -low).bit_length() - 1
+        last = last * 8 + high.bit_length() - 1
+        start = date.fromordinal(self.epoch.toordinal() + first)
+        end = date.fromordinal(self.epoch.toordinal() + last)
+        return list(range(start.year, end.year + 1))
+
+    def count(self, start, end) -> int:
+        """
+        start 부터 end 까지 켜진 비트 개수
+        """
+        return bin(self.__bits(start, end)).count("1")
+
+    def flush(self):
+        with self.lock:
+            self.map.flush()
+
+    def close(self):
+        with self.lock:
+            self.map.flush()
+            self.map.close()
+            self.file.close()
+
+    def __readHeader(self) -> date:
+        """
+        헤더를 확인하고 파일의 epoch 를 가져옴\n
+        헤더가 없거나 모르는 버전이라면 잘못 읽지 않도록 ValueError
+        """
+        if len(self.map) < self.header.size:
+            raise ValueError(f"{self.path} 에 헤더가 없음")
+        magic, version, _, epoch = self.header.unpack_from(self.map)
+        if magic != self.magic:
+            raise ValueError(f"{self.path} 는 헤더가 없는 예전 형식이거나 goal.bits 파일이 아님")
+        if version != self.version:
+            raise ValueError(f"{self.path} 는 지원하지 않는 버전: {version}")
+        return date.fromordinal(epoch)
+
+    def __bits(self, start, end) -> int:
+        """
+        start 부터 end 까지의 비트를 정수로 가져옴
+        """
+        if end < self.epoch:
+            return 0
+        offset = max(start.toordinal() - self.epoch.toordinal(), 0) & 7
+        count = end.toordinal() - start.toordinal() + 1
+        with self.lock, self.view(start, end) as view:
+            bits = int.from_bytes(view, "little")
+        return bits >> offset & ((1 << count) - 1)
+
+    def __grow(self, index):
+        """
+        index 비트가 들어갈 수 있도록 파일 크기를 늘림\n
+        한번에 일년치 (46 바이트) 이상씩 늘립니다
+        """
+        size = len(self.map)
+        need = self.header.size + (index >> 3) + 1
+        if need <= size:
+            return
+        size = max(need, size + 46)
+        self.map.flush()
+        self.map.close()
+        self.file.truncate(size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+
+def migrate(path) -> int:
+    """
+    {year}.json 파일들을 BitmapFile 로 옮김\n
+    저널에 남은 기록도 같이 옮깁니다
+
+    Args:
+        path (str): {year}.json 파일들이 있는 위치
+
+    Returns:
+        int: 옮긴 체크 개수
+    """
+    file = File(path)
+    bitmap = BitmapFile(path)
+
+    count = 0
+    # 저널에만 있는 년도까지 File.years 로 찾음 (years 가 대기열을 먼저 저장함)
+    file.flush()
+    for year in file.years():
+        for month, days in file.readYear(year).items():
+            for day in days:
+                if date(year, int(month), day) < bitmap.epoch:
+                    continue  # BitmapFile 에 저장할 수 없는 날짜
+                bitmap.set(year, int(month), day, True)
+                count += 1
+
+    file.close()
+    bitmap.close()
+    return count
+
+
+class SqliteStorage(Storage):
+    """
+    여러 목표를 SQLite 데이터베이스 하나에 저장하는 클래스
+
+    (목표, 날짜) 가 키인 테이블에 저장하고 날짜 인덱스를 만들어서
+    기간 검색, 개수, 목표별 합계를 쿼리 한번에 구합니다
+
+    Args:
+        path (str): 데이터베이스 파일 위치\n
+        goal (str): 목표 이름
+    """
+
+    name = "goal.db"
+
+    def __init__(self, path, goal):
+        self.path = path
+        self.goal = goal
+        self.lock = threading.Lock()
+        import sqlite3  # 데이터베이스를 쓸때만 불러옴
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS checks ("
+                "goal TEXT NOT NULL, day INTEGER NOT NULL, "
+                "PRIMARY KEY (goal, day)) WITHOUT ROWID"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS checks_day ON checks (day, goal)"
+            )
+        self.queue = SaveQueue(self)
+
+    def readYear(self, year) -> dict:
+        # 읽는 도중 데이터베이스로 옮겨진 기록을 놓치지 않도록 대기열을 먼저 복사
+        queued = self.queue.changes(year)
+        data = emptyYear()
+        for d in self.__select(date(year, 1, 1), date(year, 12, 31)):
+            data[str(d.month)].add(d.day)
+        return self.queue.apply(year, data, queued)
+
+    def commit(self, year, month, day, is_bool):
+        """
+        기록을 저장 대기열에 넣습니다\n
+        실제 저장은 SaveQueue 쓰레드가 extend 로 합니다
+        """
+        self.queue.put(year, month, day, is_bool)
+
+    def extend(self, records):
+        """
+        여러 기록을 트랜잭션 한번에 저장
+
+        Args:
+            records (list): (년, 월, 일, bool) 의 리스트
+        """
+        checks = [
+            (self.goal, date(year, month, day).toordinal())
+            for year, month, day, is_bool in records
+            if is_bool
+        ]
+        unchecks = [
+            (self.goal, date(year, month, day).toordinal())
+            for year, month, day, is_bool in records
+            if not is_bool
+        ]
+        with self.lock, self.db:
+            self.db.executemany("INSERT OR IGNORE INTO checks VALUES (?, ?)", checks)
+            self.db.executemany("DELETE FROM checks WHERE goal = ? AND day = ?", unchecks)
+
+    def days(self, start, end) -> list:
+        self.queue.flush()
+        return self.__select(start, end)
+
+    def years(self) -> list:
+        self.queue.flush()
+        with self.lock:
+            first, last = self.db.execute(
+                "SELECT MIN(day), MAX(day) FROM checks WHERE goal = ?", (self.goal,)
+            ).fetchone()
+        if first is None:
+            return []
+        return list(range(date.fromordinal(first).year, date.fromordinal(last).year + 1))
+
+    def count(self, start, end) -> int:
+        self.queue.flush()
+        with self.lock:
+            (count,) = self.db.execute(
+                "SELECT COUNT(*) FROM checks WHERE goal = ? AND day BETWEEN ? AND ?",
+                (self.goal, start.toordinal(), end.toordinal()),
+            ).fetchone()
+        return count
+
+    def summary(self, start, end) -> dict:
+        """
+        start 부터 end 까지 목표별 체크 개수
+
+        Args:
+            start (date)\n
+            end (date): 포함
+
+        Returns:
+            dict: {목표: 개수}
+        """
+        self.queue.flush()
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT goal, COUNT(*) FROM checks WHERE day BETWEEN ? AND ? "
+                "GROUP BY goal",
+                (start.toordinal(), end.toordinal()),
+            ).fetchall()
+        return dict(rows)
+
+    def goals(self) -> list:
+        """
+        데이터베이스에 들어있는 목표 이름들
+        """
+        self.queue.flush()
+        with self.lock:
+            rows = self.db.execute("SELECT DISTINCT goal FROM checks").fetchall()
+        return [goal for (goal,) in rows]
+
+    def flush(self):
+        self.queue.flush()
+
+    def close(self):
+        try:
+            self.queue.close()
+        finally:
+            with self.lock:
+                self.db.close()
+
+    def __select(self, start, end) -> list:
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT day FROM checks WHERE goal = ? AND day BETWEEN ? AND ? "
+                "ORDER BY day",
+                (self.goal, start.toordinal(), end.toordinal()),
+            ).fetchall()
+        return [date.fromordinal(day) for (day,) in rows]
+
+
+def createStorage(kind, path, name) -> Storage:
+    """
+    옵션에 맞는 저장소를 만듦
+
+    Args:
+        kind (str): "json", "bitmap", "sqlite"\n
+        path (str): 저장할 위치\n
+        name (str): 목표 이름
+
+    Returns:
+        Storage
+    """
+    if kind == "sqlite":
+        return SqliteStorage(os.path.join(path, SqliteStorage.name), name)
+
+    path = os.path.join(path, name)
+    if kind == "bitmap":
+        return BitmapFile(path)
+    return File(path)
+
+
+def openStorage(script, kind) -> Storage:
+    """
+    goal 을 실행하는 파일과 같은 폴더에 파일 이름으로 저장하는 저장소를 엶\n
+    DataController, Statistics, History, python -m goal 이 같은 기록을 씁니다
+
+    Args:
+        script (str): goal 을 실행하는 파일 위치\n
+        kind (str): "json", "bitmap", "sqlite"
+
+    Returns:
+        Storage
+    """
+    path, name = os.path.split(os.path.abspath(script))
+    name = os.path.splitext(name)[0]
+    return createStorage(kind, path, name)
@@ -0,0 +1,152 @@
+import time, threading
+
+from .bitmap import fold
+
+
+class SaveQueue:
+    """
+    저장할 기록을 모아두었다가 백그라운드 쓰레드에서 저장하는 클래스
+
+    같은 달을 빠르게 여러번 누르면 마지막 값만 남기고 한번에 씁니다\n
+    마지막 기록 후 delay 초가 지나거나 flush 를 부르면 저장합니다
+
+    Args:
+        target (Journal): 실제로 기록을 저장할 클래스\n
+                          extend(records) 가 있어야 함 (Journal, SqliteStorage)
+        delay (float): 저장을 미룰 시간 (초)
+    """
+
+    def __init__(self, target, delay=0.5):
+        self.target = target
+        self.delay = delay
+
+        self.pending = {}  # 저장 대기중인 기록 {(년, 월): {일: bool}}
+        self.writing = {}  # 저장중인 기록
+        self.deadline = 0
+        self.force = False
+        self.closed = False
+        self.error = None
+        self.listener = None  # 저장이 끝나면 (넣은 때부터 걸린 시간) 을 받는 함수
+        self.times = {}  # listener 가 있을때만 {(년, 월, 일): 넣은 시간}
+        self.condition = threading.Condition()
+
+        self.thread = threading.Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+    def put(self, year, month, day, is_bool):
+        """
+        기록을 대기열에 넣음
+
+        Args:
+            year (int)\n
+            month (int)\n
+            day (int)\n
+            is_bool (bool): true - 체크, false - 체크 해제
+        """
+        with self.condition:
+            self.pending.setdefault((year, month), {})[day] = is_bool
+            self.deadline = time.monotonic() + self.delay
+            if self.listener is not None:
+                self.times.setdefault((year, month, day), time.perf_counter())
+            self.condition.notify_all()
+
+    def changes(self, year) -> list:
+        """
+        아직 저장되지 않은 year 년 기록을 복사해서 가져옴
+
+        Returns:
+            list: [(월, {일: bool}), ...] 오래된 기록부터
+        """
+        with self.condition:
+            return [
+                (month, dict(days))
+                for layer in (self.writing, self.pending)
+                for (y, month), days in layer.items()
+                if y == year
+            ]
+
+    def apply(self, year, data, changes=None) -> dict:
+        """
+        아직 저장되지 않은 기록을 데이터에 덮어씀
+
+        Args:
+            year (int)\n
+            data (dict): 저장소에서 읽어온 {"월": MonthBits}\n
+            changes (list): 저장소를 읽기 전에 changes 로 가져온 기록, 없다면 지금 기록
+
+        Returns:
+            dict: 기록이 반영된 데이터
+        """
+        if changes is None:
+            changes = self.changes(year)
+        return fold(data, changes)
+
+    def flush(self):
+        """
+        대기중인 기록이 모두 저장될때까지 기다림
+        """
+        with self.condition:
+            self.force = True
+            self.condition.notify_all()
+            while (self.pending or self.writing) and self.error is None:
+                self.condition.wait()
+            self.force = False
+            if self.error is not None:
+                error, self.error = self.error, None
+                raise error
+
+    def close(self):
+        """
+        대기중인 기록을 저장하고 쓰레드를 멈춤\n
+        저장에 실패해도 쓰레드는 멈추고 에러를 다시 raise 합니다
+        """
+        try:
+            self.flush()
+        finally:
+            with self.condition:
+                self.closed = True
+                self.condition.notify_all()
+            self.thread.join()
+
+    def __run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                # 닫힌 뒤에는 한번만 더 저장해보고 실패하면 멈춤
+                if self.closed and (not self.pending or self.error is not None):
+                    return
+                while not self.force and not self.closed:
+                    remain = self.deadline - time.monotonic()
+                    if remain <= 0:
+                        break
+                    self.condition.wait(remain)
+                self.writing, self.pending = self.pending, {}
+                records = [
+                    (year, month, day, is_bool)
+                    for (year, month), days in self.writing.items()
+                    for day, is_bool in days.items()
+                ]
+                times = [self.times.pop(record[:3], None) for record in records]
+
+            try:
+                self.target.extend(records)
+                with self.condition:
+                    self.error = None  # 다시 저장했다면 이전 실패는 지움
+                if self.listener is not None:
+                    now = time.perf_counter()
+                    for t in times:
+                        if t is not None:
+                            self.listener(now - t)
+            except Exception as e:
+                with self.condition:
+                    self.error = e
+                    # 저장하지 못한 기록은 버리지 않고 대기열에 되돌림 (뒤에 넣은 기록이 우선)
+                    for key, days in self.writing.items():
+                        days.update(self.pending.get(key, {}))
+                        self.pending[key] = days
+                    self.deadline = time.monotonic() + self.delay
+            finally:
+                with self.condition:
+                    self.writing = {}
+                    self.condition.notify_all()